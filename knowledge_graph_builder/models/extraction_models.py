@@ -26,8 +26,8 @@ class ConceptExtraction(BaseModel):
     )
 
 
-class CanonicalExtractionResult(BaseModel):
-    """Complete structured extraction result for technical document analysis."""
+class _ExtractionHeader(BaseModel):
+    """Topic, summary and keywords shared by the keyed and compact extraction schemas."""
 
     topic: str = Field(
         description="Single concise title summarizing the session's overall subject. "
@@ -46,6 +46,10 @@ class CanonicalExtractionResult(BaseModel):
         max_length=10
     )
 
+
+class CanonicalExtractionResult(_ExtractionHeader):
+    """Complete structured extraction result for technical document analysis."""
+
     concepts: List[ConceptExtraction] = Field(
         description="All important theories, models, technologies, frameworks, or technical terms. "
                    "Each must include precise definition derived from the text.",
@@ -53,6 +57,36 @@ class CanonicalExtractionResult(BaseModel):
     )
 
 
+class CompactCanonicalExtractionResult(_ExtractionHeader):
+    """
+    Token-lean extraction result emitted by the LLM.
+
+    Concepts are positional `[name, definition, text_evidence]` arrays instead of
+    keyed objects, so the model does not repeat the field labels for every concept.
+    """
+
+    concepts: List[List[str]] = Field(
+        description="All important theories, models, technologies, frameworks, or technical terms, "
+                   "each as a positional array [name, definition, text_evidence].",
+        min_length=0
+    )
+
+    def to_canonical(self) -> CanonicalExtractionResult:
+        """Zip each positional concept array back into a keyed `ConceptExtraction`."""
+        concepts = []
+        for row in self.concepts:
+            name, definition, text_evidence = (list(row) + ["", "", ""])[:3]
+            if name:
+                concepts.append(ConceptExtraction(name=name, definition=definition, text_evidence=text_evidence))
+
+        return CanonicalExtractionResult(
+            topic=self.topic,
+            summary=self.summary,
+            keywords=self.keywords,
+            concepts=concepts
+        )
+
+
 class CanonicalExtractionWithText(CanonicalExtractionResult):
     """Extended extraction result that includes the original processed text."""
 
@@ -6,6 +6,8 @@ generation and validation workflow, including quality metrics, history tracking,
 and convergence analysis.
 """
 
+import sys
+from functools import lru_cache
 from typing import List, Dict, Optional, TypedDict, Tuple, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -15,6 +17,10 @@ from models.neo4j_models import ConceptRelationship
 # ============================================================================
 # Helper Functions for String-Based Keys (LangSmith-compatible)
 # ============================================================================
+# Keys stay strings so traced and serialized state has str dict keys. They are
+# interned, so a key rebuilt in a later iteration is the same object as the one
+# already stored (identity-fast dict hits, one copy in memory), and parsing is
+# memoized because weak-pattern keys are re-parsed for every prompt.
 
 def make_merge_key(concept_a: str, concept_b: str) -> str:
     """
@@ -30,8 +36,9 @@ def make_merge_key(concept_a: str, concept_b: str) -> str:
     Returns:
         String key in format "concept1|||concept2" (sorted)
     """
-    sorted_concepts = sorted([concept_a, concept_b])
-    return f"{sorted_concepts[0]}|||{sorted_concepts[1]}"
+    if concept_b < concept_a:
+        concept_a, concept_b = concept_b, concept_a
+    return sys.intern(f"{concept_a}|||{concept_b}")
 
 
 def make_relationship_key(source: str, target: str, relation: str) -> str:
@@ -49,9 +56,10 @@ def make_relationship_key(source: str, target: str, relation: str) -> str:
     Returns:
         String key in format "source|||target|||relation"
     """
-    return f"{source}|||{target}|||{relation}"
+    return sys.intern(f"{source}|||{target}|||{relation}")
 
 
+@lru_cache(maxsize=65536)
 def parse_merge_key(key: str) -> Tuple[str, str]:
     """
     Parse a merge key back into concept names.
@@ -66,6 +74,7 @@ def parse_merge_key(key: str) -> Tuple[str, str]:
     return parts[0], parts[1]
 
 
+@lru_cache(maxsize=65536)
 def parse_relationship_key(key: str) -> Tuple[str, str, str]:
     """
     Parse a relationship key back into components.
@@ -371,6 +380,26 @@ class WorkflowConfiguration(BaseModel):
         default=True,
         description="Enable detailed logging output"
     )
+    generation_shard_size: Optional[int] = Field(
+        default=None,
+        ge=2,
+        description="Concepts per relationship-generation prompt; larger lists are split into "
+                    "overlapping shards generated concurrently (None sends all concepts in one prompt)"
+    )
+    generation_shard_overlap: int = Field(
+        default=10,
+        ge=0,
+        description="Concepts shared by consecutive generation shards"
+    )
+    checkpoint_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for LangGraph checkpoints; an interrupted run with the same "
+                    "run name resumes from its last completed node (None disables checkpointing)"
+    )
+    debug_dump_iterations: bool = Field(
+        default=False,
+        description="Write the full state to iteration_logs/ after every phase (debugging only)"
+    )
     
     class Config:
         # Allow arbitrary types
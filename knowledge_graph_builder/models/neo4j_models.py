@@ -98,7 +98,7 @@ class Neo4jGraphData(BaseModel):
                 {
                     "id": node.id,
                     "label": node.label,
-                    "properties": node.properties.dict()
+                    "properties": node.properties.model_dump()
                 }
                 for node in self.nodes
             ],
@@ -108,7 +108,7 @@ class Neo4jGraphData(BaseModel):
                     "relationship_type": rel.relationship_type,
                     "start_node_id": rel.start_node_id,
                     "end_node_id": rel.end_node_id,
-                    "properties": rel.properties.dict()
+                    "properties": rel.properties.model_dump()
                 }
                 for rel in self.relationships
             ]
@@ -128,7 +128,7 @@ class ConceptRelationship(BaseModel):
     """Semantic relationship between two concepts."""
     s: str = Field(description="Source concept")
     t: str = Field(description="Target concept")
-    rel: str = Field(description="SAME_AS, USED_FOR, or RELATED_TO")
+    rel: str = Field(description="Relation type code from the prompt legend (e.g. U=USED_FOR, R=RELATED_TO)")
     r: str = Field(description="Concise explanation (max 80 chars)")
 
     class Config:
@@ -3,8 +3,13 @@ Prompt Templates for Concept Normalization Workflow
 
 This module contains prompts for finding and validating similar concepts
 that should be merged into canonical forms.
+
+`*_PROMPT` templates are compiled lazily on first attribute access (see
+`__getattr__`).
 """
 
+from functools import cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
@@ -50,14 +55,10 @@ Note: You see names only. Validator checks definitions. Return empty if no confi
 Keys: concept_a, concept_b, canonical, variants, r=reasoning"""
 
 
-CONCEPT_NORMALIZATION_USER_TEMPLATE = """# Concepts ({num_concepts})
+CONCEPT_NORMALIZATION_CONCEPTS_TEMPLATE = """# Concepts ({num_concepts})
 
 {concept_list}
 
-# AVOID These Weak Merges ({num_weak})
-
-{weak_merges_list}
-
 ---
 
 **Task**: Find concepts that LOOK similar by name. Validator will verify with definitions.
@@ -67,6 +68,7 @@ CONCEPT_NORMALIZATION_USER_TEMPLATE = """# Concepts ({num_concepts})
 - Use exact concept names as they appear in the list (all lowercase)
 - DO NOT propose merges with concepts not in the list
 - If an acronym like "ml" is not in the list, DO NOT propose it even if "machine learning" exists
+- Skip the weak merges listed at the end
 
 **Standards**:
 - High confidence matches only
@@ -74,11 +76,23 @@ CONCEPT_NORMALIZATION_USER_TEMPLATE = """# Concepts ({num_concepts})
 - Return empty list if no strong candidates found
 - Never force merges"""
 
+# The only part that changes between iterations; kept last so the concept
+# block above stays a fixed prefix
+CONCEPT_NORMALIZATION_WEAK_MERGES_TEMPLATE = """
 
-CONCEPT_NORMALIZATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", CONCEPT_NORMALIZATION_SYSTEM_TEMPLATE),
-    ("human", CONCEPT_NORMALIZATION_USER_TEMPLATE)
-])
+# AVOID These Weak Merges ({num_weak})
+
+{weak_merges_list}"""
+
+CONCEPT_NORMALIZATION_USER_TEMPLATE = CONCEPT_NORMALIZATION_CONCEPTS_TEMPLATE + CONCEPT_NORMALIZATION_WEAK_MERGES_TEMPLATE
+
+
+@cache
+def _build_concept_normalization_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", CONCEPT_NORMALIZATION_SYSTEM_TEMPLATE),
+        ("human", CONCEPT_NORMALIZATION_USER_TEMPLATE)
+    ])
 
 
 # =============================================================================
@@ -151,8 +165,17 @@ MERGE_VALIDATION_USER_TEMPLATE = """# Merge Proposals ({num_merges})
 Return ONLY merges that should NOT happen (weak merges)."""
 
 
-MERGE_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", MERGE_VALIDATION_SYSTEM_TEMPLATE),
-    ("human", MERGE_VALIDATION_USER_TEMPLATE)
-])
+@cache
+def _build_merge_validation_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", MERGE_VALIDATION_SYSTEM_TEMPLATE),
+        ("human", MERGE_VALIDATION_USER_TEMPLATE)
+    ])
+
 
+def __getattr__(name: str) -> ChatPromptTemplate:
+    """Build `*_PROMPT` templates on first access (PEP 562) instead of at import."""
+    builder = globals().get(f"_build_{name.lower()}") if name.endswith("_PROMPT") else None
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
@@ -4,11 +4,55 @@ Enhanced Prompt Templates for Iterative Relationship Detection with Quality Scor
 This module contains advanced ChatPromptTemplate-based prompts that incorporate
 quality metrics, detailed validation criteria, and structured feedback for the
 enhanced LangGraph workflow.
+
+`*_PROMPT` templates are compiled lazily on first attribute access (see
+`__getattr__`), so importing the module only pays for the raw template strings.
 """
 
+from functools import cache
+from typing import Dict, Optional
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+def build_relationship_type_codes(relationship_types: Dict[str, str]) -> Dict[str, str]:
+    """
+    Assign a single-character output code to each relationship type.
+
+    Each type gets the first letter of its name not already taken
+    (USED_FOR -> U, RELATED_TO -> R, ...). Returns a code -> type mapping.
+    """
+    codes: Dict[str, str] = {}
+    for rel_type in relationship_types:
+        code = next((ch for ch in rel_type.replace("_", "") if ch not in codes), rel_type)
+        codes[code] = rel_type
+    return codes
+
+
+def build_relationship_types_desc(
+    relationship_types: Dict[str, str],
+    type_codes: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Render the `{relationship_types_desc}` block for the generation prompts.
+
+    When `type_codes` (code -> type) is given, each line leads with the code the
+    model must emit in `rel`. The result is static for a given workflow
+    configuration, so callers should build it once and bind it with
+    `ChatPromptTemplate.partial()`.
+    """
+    if not type_codes:
+        return "\n".join(
+            f"- **{rel_type}**: {desc}"
+            for rel_type, desc in relationship_types.items()
+        )
+
+    return "\n".join(
+        f"- **{code}** = {rel_type}: {relationship_types[rel_type]}"
+        for code, rel_type in type_codes.items()
+    )
+
+
 # =============================================================================
 # BINARY VALIDATION PROMPT (No Scoring - Only Valid/Weak Classification)
 # =============================================================================
@@ -80,10 +124,12 @@ Valid relationships will be calculated programmatically as:
 valid_relationships = all_relationships - weak_relationships"""
 
 
-BINARY_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", BINARY_VALIDATION_SYSTEM_TEMPLATE),
-    ("human", BINARY_VALIDATION_USER_TEMPLATE)
-])
+@cache
+def _build_binary_validation_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", BINARY_VALIDATION_SYSTEM_TEMPLATE),
+        ("human", BINARY_VALIDATION_USER_TEMPLATE)
+    ])
 
 
 # =============================================================================
@@ -140,10 +186,12 @@ Validate and return JSON with:
 - Empty operations = ready to converge"""
 
 
-ENHANCED_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", ENHANCED_VALIDATION_SYSTEM_TEMPLATE),
-    ("human", ENHANCED_VALIDATION_USER_TEMPLATE)
-])
+@cache
+def _build_enhanced_validation_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", ENHANCED_VALIDATION_SYSTEM_TEMPLATE),
+        ("human", ENHANCED_VALIDATION_USER_TEMPLATE)
+    ])
 
 
 # =============================================================================
@@ -170,7 +218,7 @@ Generate HIGH-CONFIDENCE relationships:
 - Empty list is perfectly valid if no strong relationships found
 - Never invent relationships - honesty over completeness
 
-## Relationship Types
+## Relationship Types (code = type)
 {relationship_types_desc}
 
 **Note**: SAME_AS removed - concept normalization handles duplicates/synonyms.
@@ -178,34 +226,30 @@ Generate HIGH-CONFIDENCE relationships:
 ## Output JSON
 {{
   "relationships": [
-    {{"s": "concept", "t": "concept", "rel": "TYPE", "r": "brief reason"}}
+    {{"s": "concept", "t": "concept", "rel": "{example_code}", "r": "brief reason"}}
   ]
 }}
 
 Return ONLY valid JSON. No markdown. Keep r (reasoning) under 80 chars.
-Use shortened keys: s=source, t=target, rel=relation, r=reasoning"""
+Use shortened keys: s=source, t=target, rel=relation code, r=reasoning
+Write rel as the single-letter code from the list above (e.g. "{example_code}" for {example_type}), not the full type name."""
 
 
-BINARY_GENERATION_USER_TEMPLATE = """# Concepts ({num_concepts})
+BINARY_GENERATION_CONCEPTS_TEMPLATE = """# Concepts ({num_concepts})
 
 {concept_list}
 
-# AVOID These Weak Patterns ({num_weak})
-
-{weak_patterns_list}
-
 ---
 
-**Task**: Generate NEW relationships, avoiding the weak patterns above.
+**Task**: Generate NEW relationships, avoiding the weak patterns listed at the end.
 
 **IMPORTANT**: 
 - Both source AND target must be from the concept list above
 - Use exact concept names as they appear in the list (all lowercase)
 - DO NOT use concepts not in the list
 
-**Types**:
-- **USED_FOR**: Tool/method for purpose (e.g., tensorflow → deep learning)
-- **RELATED_TO**: General association (use when USED_FOR doesn't fit)
+**Types** (emit the code in `rel`):
+{relationship_types_desc}
 
 **Standards**:
 - High confidence only
@@ -214,244 +258,28 @@ BINARY_GENERATION_USER_TEMPLATE = """# Concepts ({num_concepts})
 - Return empty list if no strong relationships found
 - Never force relationships"""
 
+# The only part that changes between iterations; kept last so the concept
+# block above stays a fixed prefix
+BINARY_GENERATION_WEAK_PATTERNS_TEMPLATE = """
 
-BINARY_GENERATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", BINARY_GENERATION_SYSTEM_TEMPLATE),
-    ("human", BINARY_GENERATION_USER_TEMPLATE)
-])
-
-
-# =============================================================================
-# LEGACY GENERATION PROMPT (Deprecated - kept for reference)
-# =============================================================================
-
-ENHANCED_GENERATOR_FIRST_SYSTEM_TEMPLATE = """You are a semantic relationship detector for technical concepts.
-
-Generate HIGH-QUALITY relationships (focus on quality over quantity):
-- **Accurate**: Factually correct, proper types and direction
-- **Specific**: Prefer USED_FOR/SAME_AS over RELATED_TO when applicable
-- **Selective**: Only STRONG, OBVIOUS relationships (avg 2-3 per concept)
-
-## Types
-{relationship_types_desc}
-
-## Output JSON
-{{
-  "relationships": [
-    {{"source": "concept", "target": "concept", "relation": "TYPE", "reasoning": "brief reason"}}
-  ]
-}}
-
-Return ONLY valid JSON. No markdown. Keep reasoning under 80 chars."""
-
-
-ENHANCED_GENERATOR_FIRST_USER_TEMPLATE = """# Concepts ({num_concepts})
-
-{concept_list}
-
----
-
-Generate IMPORTANT relationships only (quality > quantity):
-- SAME_AS: Synonyms, acronyms (e.g., ml ↔ machine learning)
-- USED_FOR: Tool/method for purpose (e.g., tensorflow → deep learning)
-- RELATED_TO: General association (use only when above don't fit)
-
-Target: ~{target_count} strong relationships. Focus on obvious, high-confidence connections."""
-
-
-ENHANCED_GENERATOR_FIRST_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", ENHANCED_GENERATOR_FIRST_SYSTEM_TEMPLATE),
-    ("human", ENHANCED_GENERATOR_FIRST_USER_TEMPLATE)
-])
-
-
-# =============================================================================
-# REFINEMENT PROMPT (DEPRECATED - NO LONGER USED)
-# =============================================================================
-#
-# NOTE: This prompt is NO LONGER USED after refactoring to programmatic operation application.
-#
-# Previously, this prompt was used to ask the LLM to apply MODIFY/DELETE/ADD operations
-# to the full relationship set. This approach had critical issues:
-# 1. LLM would regenerate relationships instead of preserving them (relationship loss)
-# 2. Quality degradation due to incomplete relationship sets
-# 3. Operations not applied correctly
-#
-# NEW APPROACH (implemented in enhanced_langgraph_service.py):
-# - MODIFY/DELETE operations: Applied programmatically in Python (_apply_operations_programmatically)
-# - ADD operations: LLM generates only NEW relationships (_generate_new_relationships)
-# - Result: Zero relationship loss, exact operation application, predictable behavior
-#
-# This prompt is kept for historical reference and documentation purposes.
-# If you need to modify how operations are applied, edit the Python code, not this prompt.
-# =============================================================================
-
-ENHANCED_GENERATOR_REFINEMENT_SYSTEM_TEMPLATE = """# Role
-You are a **precise relationship editor** applying validated operations to improve relationship quality.
-
-# Mission
-**PRESERVE ALL RELATIONSHIPS** unless explicitly told to delete them.
-
-Apply operations with surgical precision - no regeneration, only targeted edits.
-
-## Operation Types
-
-### 1. MODIFY [CHANGE]
-Find exact match → Change specified fields → Keep everything else
-
-**Example**:
-- Operation: {{source: "A", relation: "RELATED_TO", target: "B", new_relation: "USED_FOR"}}
-- Action: Find "A --[RELATED_TO]--> B" → Change to "A --[USED_FOR]--> B"
-
-### 2. DELETE [REMOVE]
-Find exact match → Remove completely
-
-**Example**:
-- Operation: {{source: "A", relation: "X", target: "B"}}
-- Action: Find "A --[X]--> B" → Remove it
-
-### 3. ADD [NEW]
-Create new relationship → Add to list
-
-**Example**:
-- Operation: {{source: "C", relation: "Z", target: "D", reasoning: "..."}}
-- Action: Add "C --[Z]--> D" with reasoning
-
-## Matching Rules (EXACT MATCH REQUIRED)
-
-### String Comparison
-**Case-sensitive and whitespace-sensitive**:
-- "Machine Learning" ≠ "machine learning"
-- "Data Science" ≠ "Data Science "
-
-**Exact match required**:
-```
-operation.source == relationship.source AND
-operation.relation == relationship.relation AND
-operation.target == relationship.target
-```
-
-### If No Exact Match
-- **DO NOT** guess or find similar relationships
-- **SKIP** that operation
-- **PRESERVE** original relationships unchanged
-
-## The Golden Rule: PRESERVATION
-
-**DEFAULT ACTION**: Copy relationship unchanged
-
-Only modify/delete if **EXACT MATCH** found.
-
-**Example**:
-- Current: 100 relationships
-- Operations: MODIFY 3, DELETE 2, ADD 5
-- Output: 103 relationships (100 - 2 deleted - 3 modified + 3 modified + 5 added)
-
-## Output Format
-
-{{
-  "relationships": [
-    {{
-      "source": "exact concept name",
-      "target": "exact concept name",
-      "relation": "RELATION_TYPE",
-      "reasoning": "brief explanation"
-    }}
-  ]
-}}
-
-**CRITICAL**:
-- Return ONLY valid JSON (no markdown, no code fences)
-- Include ALL relationships (modified + unchanged + added)
-- Do NOT regenerate - only edit the provided list"""
-
-
-ENHANCED_GENERATOR_REFINEMENT_USER_TEMPLATE = """# Current Relationships ({num_current} total)
-**IMPORTANT**: Account for ALL {num_current} relationships in your output!
-
-{relationships_summary}
-
----
-
-# Operations to Apply ({total_ops} total)
-
-## Quality Context
-**Previous Quality Score**: {previous_quality_score:.2f}
-**Target Quality Score**: 0.85+
-
-## MODIFY Operations ({num_modify})
-{modify_summary}
-
-## DELETE Operations ({num_delete})
-{delete_summary}
-
-## ADD Operations ({num_add})
-{add_summary}
-
----
-
-# Allowed Relationship Types
-{relationship_types_desc}
-
----
-
-# Application Algorithm
-
-## Step-by-Step Process
-
-1. **CREATE** empty output list
-
-2. **FOR EACH** of the {num_current} current relationships:
-
-   a. Check if it matches ANY DELETE operation (exact source/relation/target)
-      - IF YES: Skip it (don't add to output)
-      - IF NO: Continue to step b
-
-   b. Check if it matches ANY MODIFY operation (exact source/relation/target)
-      - IF YES: Apply modification (change specified fields)
-                Add MODIFIED version to output
-      - IF NO: Add UNCHANGED to output
-
-3. **FOR EACH** ADD operation:
-   - Add new relationship to output
-
-4. **RETURN** output list
-
-## Expected Output Count
-
-- Starting: {num_current} relationships
-- After DELETE: {num_current} - {num_delete} = {expected_after_delete}
-- After MODIFY: Same count (just changed fields)
-- After ADD: {expected_after_delete} + {num_add} = {expected_final}
-
-**Expected final count**: Approximately {expected_final} relationships
-
-## Quality Checks
-
-Before returning, verify:
-1. ✅ Did I include ALL {num_current} relationships (unless deleted)?
-2. ✅ Did I apply all {num_modify} MODIFY operations?
-3. ✅ Did I remove all {num_delete} DELETE targets?
-4. ✅ Did I add all {num_add} ADD operations?
-5. ✅ Is my output count close to expected ({expected_final})?
-
-**If output count differs significantly from input, YOU MADE A MISTAKE!**
-
----
+# AVOID These Weak Patterns ({num_weak})
 
-# Output
+{weak_patterns_list}"""
 
-Return JSON with ALL relationships after applying operations.
+BINARY_GENERATION_USER_TEMPLATE = BINARY_GENERATION_CONCEPTS_TEMPLATE + BINARY_GENERATION_WEAK_PATTERNS_TEMPLATE
 
-**CRITICAL**:
-- No markdown code fences
-- Include modified + unchanged + added relationships
-- Do NOT regenerate from scratch
-- Preserve all relationships not explicitly modified/deleted"""
 
+@cache
+def _build_binary_generation_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", BINARY_GENERATION_SYSTEM_TEMPLATE),
+        ("human", BINARY_GENERATION_USER_TEMPLATE)
+    ])
 
-ENHANCED_GENERATOR_REFINEMENT_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", ENHANCED_GENERATOR_REFINEMENT_SYSTEM_TEMPLATE),
-    ("human", ENHANCED_GENERATOR_REFINEMENT_USER_TEMPLATE)
-])
 
+def __getattr__(name: str) -> ChatPromptTemplate:
+    """Build `*_PROMPT` templates on first access (PEP 562) instead of at import."""
+    builder = globals().get(f"_build_{name.lower()}") if name.endswith("_PROMPT") else None
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
@@ -50,9 +50,22 @@ TASK_INSTRUCTION = """Analyze the following technical document and extract struc
 
 Ensure all extractions are grounded in the source text and maintain technical precision."""
 
+# Compact output encoding: concepts as positional arrays instead of keyed objects
+COMPACT_OUTPUT_INSTRUCTION = """**Output Encoding**:
+- Return `{{"topic": "...", "summary": "...", "keywords": [...], "concepts": [...]}}`
+- Emit each concept as a positional array `["name", "definition", "text_evidence"]` in exactly that order
+- Do NOT write `name`/`definition`/`text_evidence` keys for concepts"""
+
 # Complete prompt template combining system and task instructions
 COMPLETE_EXTRACTION_PROMPT = f"""{SYSTEM_INSTRUCTION}
 
+{COMPACT_OUTPUT_INSTRUCTION}
+
+{TASK_INSTRUCTION}"""
+
+# Keyed-object variant for callers that still parse `CanonicalExtractionResult` directly
+LEGACY_COMPLETE_EXTRACTION_PROMPT = f"""{SYSTEM_INSTRUCTION}
+
 {TASK_INSTRUCTION}"""
 
 # Few-shot examples for better model performance
@@ -60,6 +73,24 @@ EXTRACTION_EXAMPLES = """
 **Example Input:**
 "The Big Data lifecycle has four stages: Collect, Store, Analyze, and Governance. Collecting involves gathering structured and unstructured data. Storage relies on platforms like HDFS and databases. Analysis applies tools like MapReduce, Spark, and MySQL. Governance ensures compliance, accuracy, and security. The DIKW pyramid explains the transformation from data to information, knowledge, and wisdom."
 
+**Example Output:**
+{{
+  "topic": "Big Data Lifecycle and Analysis Frameworks",
+  "summary": "The Big Data lifecycle consists of four stages: collection, storage, analysis, and governance. Collection gathers structured and unstructured data. Storage uses HDFS, MySQL, and databases. Analysis employs MapReduce and Spark for large-scale processing. Governance ensures compliance and data quality. The DIKW pyramid illustrates the progression from raw data to actionable wisdom.",
+  "keywords": ["big data lifecycle", "collect", "store", "analyze", "governance", "DIKW pyramid", "Hadoop", "Spark", "HDFS", "MapReduce"],
+  "concepts": [
+    ["DIKW Pyramid", "A model showing the progression from data (facts) to information (organized data), to knowledge (meaningful information), and wisdom (actionable insights).", "The DIKW pyramid explains the transformation from data to information, knowledge, and wisdom."],
+    ["HDFS", "Hadoop Distributed File System, the main storage platform for big data, supporting distributed processing.", "Storage relies on platforms like HDFS and databases."],
+    ["MapReduce", "A programming model for processing large data sets with a distributed algorithm on a cluster.", "Analysis applies tools like MapReduce, Spark, and MySQL."]
+  ]
+}}
+"""
+
+# Keyed-object few-shot examples (legacy output format)
+LEGACY_EXTRACTION_EXAMPLES = """
+**Example Input:**
+"The Big Data lifecycle has four stages: Collect, Store, Analyze, and Governance. Collecting involves gathering structured and unstructured data. Storage relies on platforms like HDFS and databases. Analysis applies tools like MapReduce, Spark, and MySQL. Governance ensures compliance, accuracy, and security. The DIKW pyramid explains the transformation from data to information, knowledge, and wisdom."
+
 **Example Output:**
 {{
   "topic": "Big Data Lifecycle and Analysis Frameworks",
@@ -88,7 +119,17 @@ EXTRACTION_EXAMPLES = """
 # Template with few-shot examples for improved performance
 EXTRACTION_PROMPT_WITH_EXAMPLES = f"""{SYSTEM_INSTRUCTION}
 
+{COMPACT_OUTPUT_INSTRUCTION}
+
 **Example for Reference:**
 {EXTRACTION_EXAMPLES}
 
 {TASK_INSTRUCTION}"""
+
+# Keyed-object variant of the few-shot template (legacy output format)
+LEGACY_EXTRACTION_PROMPT_WITH_EXAMPLES = f"""{SYSTEM_INSTRUCTION}
+
+**Example for Reference:**
+{LEGACY_EXTRACTION_EXAMPLES}
+
+{TASK_INSTRUCTION}"""
@@ -6,18 +6,50 @@ Demonstrates both main services:
 2. Linking CONCEPT nodes with relationships
 """
 
+import os
 import sys
 import argparse
+import logging
+import logging.handlers
+import time
 from pathlib import Path
 from typing import Optional
 
 
+# Per-file progress for JSON ingestion; buffered so tight loops don't pay a write per file
+progress_logger = logging.getLogger("kg_builder.progress")
+progress_logger.propagate = False
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once `flush_interval` seconds pass since the last flush."""
+
+    def __init__(self, capacity: int, flush_interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
 def run_extraction(
     input_dir: str = "unstructured_script",
     output_dir: str = "batch_output",
     clear_db: bool = False,
     single_file: Optional[str] = None,
     insert_to_neo4j: bool = True,
+    use_embedding_cache: bool = True,
+    max_workers: int = 1,
+    force: bool = False,
+    use_semantic_cache: bool = False,
 ):
     """
     SERVICE 1: Extract concepts from DOCX files.
@@ -27,6 +59,10 @@ def run_extraction(
         output_dir: Directory to save extraction results
         clear_db: Whether to clear Neo4j database before processing
         single_file: Optional path to process only a single file
+        use_embedding_cache: Reuse embeddings cached on disk by earlier runs
+        max_workers: Number of DOCX files extracted in parallel processes
+        force: Re-process files recorded in the output directory's manifest
+        use_semantic_cache: Reuse extractions of identical or re-edited documents from earlier runs
     """
     print("\n" + "="*80)
     print("📚 SERVICE 1: EXTRACTING CONCEPTS FROM DOCUMENTS")
@@ -37,7 +73,14 @@ def run_extraction(
     if clear_db and not insert_to_neo4j:
         print("\n⚠️  --clear requested but --no-ingestion is set; skipping DB clear.")
 
-    ingestion = IngestionService()
+    if use_embedding_cache:
+        ingestion = IngestionService(use_semantic_cache=use_semantic_cache)
+    else:
+        from services.embedding import EmbeddingService
+        ingestion = IngestionService(
+            embedding_service=EmbeddingService(),
+            use_semantic_cache=use_semantic_cache
+        )
     
     if single_file:
         print(f"\n🔍 Processing single file: {single_file}")
@@ -59,13 +102,16 @@ def run_extraction(
         result = ingestion.process_batch_documents(
             input_directory=input_dir,
             output_directory=output_dir,
-            clear_database=clear_db
+            clear_database=clear_db,
+            max_workers=max_workers,
+            force=force
         )
         
         print(f"\n📊 Batch Processing Results:")
         print(f"   Total files: {result['total_files']}")
         print(f"   Successful: {result['successful']}")
         print(f"   Failed: {result['failed']}")
+        print(f"   Skipped: {result.get('skipped', 0)}")
         print(f"   Time: {result['processing_time']:.2f}s")
         
         if result['failed_files']:
@@ -74,9 +120,44 @@ def run_extraction(
     return True
 
 
+# Files already ingested into Neo4j, keyed by path -> [mtime_ns, size]
+INGESTION_MANIFEST_NAME = ".ingested.json"
+
+
+def _file_signature(path: Path) -> list:
+    """Cheap change detector for the ingestion manifest."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _build_extraction_graph_data(neo4j, json_file: Path, topic_name: str):
+    """
+    Load one extraction JSON and convert it to graph data.
+
+    Runs on worker threads (the theory embedding is a network call); the
+    Neo4j writes are batched on the main thread.
+
+    Returns:
+        Neo4jGraphData from `create_graph_data_from_dict`
+    """
+    from utils.doc_utils import load_json_file
+
+    # Load JSON data and pass it straight through; it was validated at extraction time
+    data = load_json_file(json_file)
+    
+    return neo4j.create_graph_data_from_dict(
+        data=data,
+        source_file=str(json_file),
+        default_topic=topic_name
+    )
+
+
 def run_json_ingestion(
     batch_output_dir: str = "batch_output",
-    clear_db: bool = False
+    clear_db: bool = False,
+    max_workers: int = 8,
+    batch_size: int = 50,
+    use_embedding_cache: bool = True
 ):
     """
     SERVICE 1B: Load already-extracted JSON files into Neo4j.
@@ -84,9 +165,16 @@ def run_json_ingestion(
     Args:
         batch_output_dir: Directory containing topic folders with extraction JSONs
         clear_db: Whether to clear Neo4j database before loading
+        max_workers: Number of files converted concurrently
+        batch_size: Number of files written to Neo4j per batch insert
+        use_embedding_cache: Reuse embeddings cached on disk by earlier runs
+    
+    Files recorded in `<batch_output_dir>/.ingested.json` with an unchanged
+    mtime and size are skipped; clearing the database resets the manifest.
     """
     import json
-    from models.extraction_models import CompleteExtractionResult, CanonicalExtractionResult, ConceptExtraction, ExtractionMetadata
+    import traceback
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     
     print("\n" + "="*80)
     print("📦 SERVICE 1B: LOADING EXISTING JSON FILES INTO NEO4J")
@@ -94,7 +182,11 @@ def run_json_ingestion(
     
     from neo4j_database import Neo4jService
 
-    neo4j = Neo4jService()
+    if use_embedding_cache:
+        neo4j = Neo4jService()
+    else:
+        from services.embedding import EmbeddingService
+        neo4j = Neo4jService(embedding_service=EmbeddingService())
     
     if clear_db:
         print("\n🗑️  Clearing database...")
@@ -109,13 +201,21 @@ def run_json_ingestion(
         print(f"❌ Error: Directory not found: {batch_output_dir}")
         return False
     
-    # Find topic folders (folders with _extraction.json files)
+    # Find topic folders (folders with _extraction.json files) in one scandir
+    # walk; dirent types avoid a stat per entry and each folder is listed once
     topic_folders = []
-    for item in batch_path.iterdir():
-        if item.is_dir():
-            json_files = list(item.glob("*_extraction.json"))
+    with os.scandir(batch_path) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as folder_entries:
+                json_files = [
+                    Path(file_entry.path)
+                    for file_entry in folder_entries
+                    if file_entry.name.endswith("_extraction.json") and file_entry.is_file()
+                ]
             if json_files:
-                topic_folders.append(item)
+                topic_folders.append((Path(entry.path), json_files))
     
     if not topic_folders:
         print(f"❌ No topic folders with extraction JSONs found in {batch_output_dir}")
@@ -123,76 +223,131 @@ def run_json_ingestion(
     
     print(f"   Found {len(topic_folders)} topic folders")
     
-    # Process each topic folder
-    total_success = 0
-    total_failed = 0
-    
-    for i, topic_folder in enumerate(topic_folders, 1):
+    # Largest topics first: warms caches early and surfaces slow outliers sooner
+    topic_folders.sort(key=lambda folder: len(folder[1]), reverse=True)
+    
+    # Load the manifest of files ingested by previous runs
+    manifest_path = batch_path / INGESTION_MANIFEST_NAME
+    ingested = {}
+    if manifest_path.exists() and not clear_db:
+        from utils.doc_utils import load_json_file
+        try:
+            ingested = load_json_file(manifest_path)
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable manifest {manifest_path}: {e}")
+    
+    # Flatten topic folders into one work list so files from all topics share the pool
+    work_items = []
+    signatures = {}
+    skipped = 0
+    for i, (topic_folder, json_files) in enumerate(topic_folders, 1):
         topic_name = topic_folder.name
-        json_files = list(topic_folder.glob("*_extraction.json"))
         
-        print(f"\n[{i}/{len(topic_folders)}] Processing topic: {topic_name}")
+        print(f"\n[{i}/{len(topic_folders)}] Queued topic: {topic_name}")
         print(f"   JSON files: {len(json_files)}")
         
         for json_file in json_files:
-            try:
-                # Load JSON data
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Convert concepts list to ConceptExtraction objects
-                concepts = [
-                    ConceptExtraction(
-                        name=c.get('name', ''),
-                        definition=c.get('definition', ''),
-                        text_evidence=c.get('text_evidence', '')
-                    )
-                    for c in data.get('concepts', [])
-                ]
-                
-                # Create extraction result from JSON
-                extraction = CanonicalExtractionResult(
-                    topic=data.get('topic', topic_name),
-                    summary=data.get('summary', ''),
-                    keywords=data.get('keywords', []),
-                    concepts=concepts
-                )
-                
-                complete_result = CompleteExtractionResult(
-                    extraction=extraction,
-                    metadata=ExtractionMetadata(
-                        source_file=str(json_file),
-                        original_text_length=0,
-                        processed_text_length=0,
-                        model_used='pre-extracted'
-                    ),
-                    success=True
-                )
-                
-                # Create graph data
-                graph_data = neo4j.create_graph_data_from_extraction(
-                    extraction_result=complete_result,
-                    source_file=str(json_file)
-                )
-                
-                # Insert into Neo4j
-                result = neo4j.insert_graph_data(
-                    graph_data=graph_data,
-                    source_file=str(json_file)
-                )
-                
-                if result.success:
-                    total_success += 1
-                    print(f"   ✅ {json_file.name}: {result.nodes_created} nodes, {result.relationships_created} relationships")
-                else:
-                    total_failed += 1
-                    print(f"   ❌ {json_file.name}: {result.error}")
-                    
-            except Exception as e:
+            signature = _file_signature(json_file)
+            if ingested.get(str(json_file)) == signature:
+                skipped += 1
+                continue
+            signatures[json_file] = signature
+            work_items.append((json_file, topic_name))
+    
+    if skipped:
+        print(f"\n⏭️  Skipping {skipped} files already ingested (see {manifest_path.name})")
+    print(f"\n🚀 Ingesting {len(work_items)} files with {max_workers} workers...")
+    
+    total_success = 0
+    total_failed = 0
+    done = 0
+    pending = []
+    
+    # Keep full tracebacks for the first few worker failures only; a systematic
+    # failure would otherwise dump one traceback per file
+    max_logged_errors = 20
+    failed_records = []
+    suppressed_errors = 0
+    
+    # Buffer progress lines (one per 10 files) and write them every 10 lines or
+    # every 2 seconds, whichever comes first; errors flush immediately
+    progress_handler = _TimedMemoryHandler(
+        capacity=10,
+        flush_interval=2.0,
+        flushLevel=logging.ERROR,
+        target=logging.StreamHandler(sys.stderr)
+    )
+    progress_logger.addHandler(progress_handler)
+    progress_logger.setLevel(logging.INFO)
+    
+    def report_progress():
+        if done % 10 == 0 or done == len(work_items):
+            progress_logger.info(
+                "   [%d/%d] ✅ %d succeeded, ❌ %d failed", done, len(work_items), total_success, total_failed
+            )
+    
+    def flush_pending():
+        nonlocal total_success, total_failed, done
+        results = neo4j.insert_graph_data_batch(
+            [(graph_data, str(json_file)) for json_file, graph_data in pending]
+        )
+        for (json_file, _), result in zip(pending, results):
+            done += 1
+            if result.success:
+                total_success += 1
+                ingested[str(json_file)] = signatures[json_file]
+            else:
                 total_failed += 1
-                print(f"   ❌ {json_file.name}: {e}")
-                import traceback
-                traceback.print_exc()
+                progress_logger.error("   %s/%s: ❌ %s", json_file.parent.name, json_file.name, result.error)
+            report_progress()
+        pending.clear()
+    
+    # Workers only build graph data; inserts and progress output stay on the main thread
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_build_extraction_graph_data, neo4j, json_file, topic_name): json_file
+                for json_file, topic_name in work_items
+            }
+            
+            for future in as_completed(futures):
+                json_file = futures[future]
+                try:
+                    pending.append((json_file, future.result()))
+                except Exception as e:
+                    done += 1
+                    total_failed += 1
+                    progress_logger.error("   %s/%s: ❌ %r", json_file.parent.name, json_file.name, e)
+                    if len(failed_records) < max_logged_errors:
+                        failed_records.append(
+                            (json_file.name, repr(e), "".join(traceback.format_exception(e)))
+                        )
+                    else:
+                        suppressed_errors += 1
+                    report_progress()
+                    continue
+                
+                if len(pending) >= batch_size:
+                    flush_pending()
+            
+            if pending:
+                flush_pending()
+    finally:
+        progress_logger.removeHandler(progress_handler)
+        progress_handler.close()
+        # Write-then-rename so an interrupted write never leaves a truncated manifest
+        temp_path = manifest_path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(ingested, f)
+        os.replace(temp_path, manifest_path)
+    
+    if failed_records:
+        print(f"\n❌ Tracebacks for failed files:")
+        for name, error, formatted in failed_records:
+            print(f"\n--- {name}: {error}")
+            print(formatted, end="")
+        if suppressed_errors:
+            print(f"\n   (+{suppressed_errors} more suppressed)")
     
     print(f"\n📊 JSON Ingestion Results:")
     print(f"   Total files processed: {total_success}")
@@ -210,7 +365,10 @@ def run_json_ingestion(
 def run_relationship_detection(
     max_iterations: int = 5,
     verbose: bool = True,
-    output_file: str = "final.json"
+    output_file: str = "final.json",
+    debug_dump: bool = False,
+    checkpoint_db: Optional[str] = None,
+    use_llm_cache: bool = True
 ):
     """
     SERVICE 2: Detect relationships between CONCEPT nodes.
@@ -219,6 +377,9 @@ def run_relationship_detection(
         max_iterations: Maximum iterations for relationship detection
         verbose: Enable verbose logging
         output_file: Output filename for results
+        debug_dump: Write per-iteration state snapshots to iteration_logs/
+        checkpoint_db: SQLite checkpoint file; an interrupted run resumes from it
+        use_llm_cache: Reuse LLM responses to identical prompts from the persistent cache
     """
     print("\n" + "="*80)
     print("🔗 SERVICE 2: LINKING CONCEPT NODES (RELATIONSHIP DETECTION)")
@@ -245,6 +406,8 @@ def run_relationship_detection(
     config = WorkflowConfiguration(
         max_iterations=max_iterations,
         verbose_logging=verbose,
+        debug_dump_iterations=debug_dump,
+        checkpoint_path=checkpoint_db,
         relationship_types={
             "USED_FOR": "Indicates practical application or purpose",
             "RELATED_TO": "General semantic or contextual connection",
@@ -257,7 +420,7 @@ def run_relationship_detection(
     print(f"\n🚀 Starting relationship detection workflow...")
     print(f"   Max iterations: {max_iterations}")
     
-    service = EnhancedRelationshipService(neo4j, config)
+    service = EnhancedRelationshipService(neo4j, config, use_llm_cache=use_llm_cache)
     relationships, output_path, workflow_stats = service.detect_relationships(
         output_file=output_file
     )
@@ -365,6 +528,39 @@ Examples:
         action="store_true",
         help="Extraction only: do NOT insert results into Neo4j"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent file ingestions when loading with --from-json (default: 8)"
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        help="Parallel DOCX extraction processes (default: min(CPU count, 4))"
+    )
+    parser.add_argument(
+        "--insert-batch-size",
+        type=int,
+        default=50,
+        help="Files written to Neo4j per batch insert with --from-json (default: 50)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk embedding cache"
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse LLM extractions of identical documents, or of earlier versions of the same file (cosine similarity >= 0.92)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-extract DOCX files already recorded in the output directory's .processed.json"
+    )
     parser.add_argument(
         "--clear",
         action="store_true",
@@ -388,6 +584,20 @@ Examples:
         action="store_true",
         help="Disable verbose logging"
     )
+    parser.add_argument(
+        "--checkpoint-db",
+        help="SQLite file for workflow checkpoints; rerunning after a failure resumes the interrupted run"
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Call the LLM for every generation/validation prompt instead of reusing cached responses"
+    )
+    parser.add_argument(
+        "--debug-dump",
+        action="store_true",
+        help="Write per-iteration workflow state to iteration_logs/ (debugging only)"
+    )
     
     args = parser.parse_args()
     
@@ -420,7 +630,10 @@ Examples:
             # Load from existing JSONs
             success = run_json_ingestion(
                 batch_output_dir=args.batch_dir,
-                clear_db=args.clear
+                clear_db=args.clear,
+                max_workers=args.workers,
+                batch_size=args.insert_batch_size,
+                use_embedding_cache=not args.no_cache
             )
         else:
             # Extract from DOCX files
@@ -430,6 +643,10 @@ Examples:
                 clear_db=args.clear,
                 single_file=args.file,
                 insert_to_neo4j=not args.no_ingestion,
+                use_embedding_cache=not args.no_cache,
+                max_workers=args.extract_workers,
+                force=args.force,
+                use_semantic_cache=args.semantic_cache,
             )
         
         if not success:
@@ -441,7 +658,10 @@ Examples:
         success = run_relationship_detection(
             max_iterations=args.max_iterations,
             verbose=not args.quiet,
-            output_file=args.output_file
+            output_file=args.output_file,
+            debug_dump=args.debug_dump,
+            checkpoint_db=args.checkpoint_db,
+            use_llm_cache=not args.no_llm_cache
         )
         if not success:
             print("\n❌ Relationship detection failed!")
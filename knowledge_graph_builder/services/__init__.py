@@ -5,12 +5,16 @@ This package contains all the service classes for handling different
 aspects of the knowledge graph building process:
 
 - EmbeddingService: Handles text embeddings using OpenAI API
+- CachedEmbedder: EmbeddingService backed by a persistent on-disk cache
+- SemanticExtractionCache: Reuses extractions of identical or re-edited documents
 - LangChainCanonicalExtractionService: LangChain-based concept extraction
 - IngestionService: Complete pipeline for knowledge graph ingestion
 - Neo4jService: Neo4j database operations using LangChain
 """
 
 from .embedding import EmbeddingService
+from .embedding_cache import CachedEmbedder, get_cached_embedder
+from .semantic_cache import SemanticExtractionCache
 from .extraction_langchain import LangChainCanonicalExtractionService
 
 # Optional imports:
@@ -28,6 +32,9 @@ except Exception:  # pragma: no cover
 
 __all__ = [
     "EmbeddingService",
+    "CachedEmbedder",
+    "get_cached_embedder",
+    "SemanticExtractionCache",
     "LangChainCanonicalExtractionService",
     "IngestionService",
     "Neo4jService",
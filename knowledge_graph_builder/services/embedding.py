@@ -1,9 +1,128 @@
 from langchain_openai import OpenAIEmbeddings
-from typing import List, Optional, Dict, Any
+from openai import APIConnectionError, InternalServerError, RateLimitError
+import asyncio
+import base64
+import httpx
+import logging
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple, TypeVar, Union
 import os
-import json
+import numpy as np
 from pydantic import SecretStr
 from dotenv import load_dotenv
+
+import orjson
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken ships with langchain-openai
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Per-request input limit of OpenAI-compatible embedding endpoints
+MAX_TOKENS_PER_REQUEST = 8191
+
+# Errors worth retrying: rate limits, 5xx responses, timeouts and dropped connections
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+MAX_RETRY_DELAY = 60.0
+
+T = TypeVar("T")
+
+
+@cache
+def _token_encoder():
+    """cl100k_base encoder, or None when tiktoken or its BPE file is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Exponential backoff with jitter, never shorter than the server's Retry-After."""
+    delay = min(MAX_RETRY_DELAY, 2 ** attempt) * random.uniform(0.5, 1.0)
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(delay, float(retry_after)) if retry_after else delay
+    except ValueError:
+        return delay
+
+
+EMBEDDING_PRECISIONS = ("fp32", "fp16", "int8")
+
+
+def encode_embedding(embedding: List[float], precision: str = "fp32") -> Any:
+    """
+    Encode an embedding for JSON storage.
+
+    "fp32" keeps the plain float list. "fp16" stores base64 float16 bytes;
+    "int8" stores base64 int8 bytes with a symmetric per-vector scale.
+    """
+    return encode_embeddings([embedding], precision)[0]
+
+
+def encode_embeddings(embeddings: Union[List[List[float]], np.ndarray], precision: str = "fp32") -> List[Any]:
+    """
+    Encode a batch of embeddings for JSON storage (see `encode_embedding`).
+
+    Quantization runs once over the whole (N, D) matrix rather than per vector.
+    """
+    if precision == "fp32":
+        return embeddings.tolist() if isinstance(embeddings, np.ndarray) else list(embeddings)
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if precision == "fp16":
+        rows = matrix.astype(np.float16)
+        return [{"dtype": "float16", "data": base64.b64encode(row.tobytes()).decode("ascii")} for row in rows]
+    if precision == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        rows = np.round(matrix / scales[:, np.newaxis]).astype(np.int8)
+        return [
+            {"dtype": "int8", "scale": float(scale), "data": base64.b64encode(row.tobytes()).decode("ascii")}
+            for scale, row in zip(scales, rows)
+        ]
+    raise ValueError(f"Unknown embedding precision: {precision!r} (expected one of {EMBEDDING_PRECISIONS})")
+
+
+def decode_embedding(value: Any) -> List[float]:
+    """Decode an embedding written by `encode_embedding` back to a float list."""
+    if not isinstance(value, dict):
+        return value
+    data = base64.b64decode(value["data"])
+    if value["dtype"] == "float16":
+        return np.frombuffer(data, dtype=np.float16).astype(np.float32).tolist()
+    if value["dtype"] == "int8":
+        return (np.frombuffer(data, dtype=np.int8).astype(np.float32) * value["scale"]).tolist()
+    raise ValueError(f"Unknown embedding dtype: {value['dtype']!r}")
+
+
+SIDECAR_FORMATS = ("jsonl", "npz")
+
+
+def load_embeddings_npz(path: str) -> Dict[str, np.ndarray]:
+    """Map node id to embedding vector from a `*.embeddings.npz` sidecar."""
+    with np.load(path) as sidecar:
+        return dict(zip(sidecar["ids"].tolist(), sidecar["embeddings"]))
+
+
+@lru_cache(maxsize=100_000)
+def count_tokens(text: str) -> int:
+    """Token count of a text (memoized), estimated from its length when no encoder is available."""
+    encoder = _token_encoder()
+    if encoder is None:
+        return len(text) // 3 + 1
+    return len(encoder.encode(text, disallowed_special=()))
+
 load_dotenv()
 class EmbeddingService:
     """Service for generating text embeddings using OpenAI-compatible API."""
@@ -12,7 +131,12 @@ class EmbeddingService:
         self,
         api_key: Optional[str] = None,
         base_url: str = "https://api.silra.cn/v1/",
-        model: str = "text-embedding-v4"
+        model: str = "text-embedding-v4",
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        embedding_precision: str = "fp32"
     ):
         """
         Initialize the embedding service.
@@ -21,17 +145,150 @@ class EmbeddingService:
             api_key: API key for authentication (if None, reads from LAB_TUTOR_LLM_API_KEY env var)
             base_url: Custom base URL for the API
             model: Model name to use for embeddings
+            batch_size: Maximum texts per embedding request for batched calls
+                (if None, reads LAB_TUTOR_EMBED_BATCH_SIZE, default 100)
+            max_tokens_per_batch: Maximum total tokens per embedding request for batched calls
+                (if None, reads LAB_TUTOR_EMBED_MAX_TOKENS, default 8191)
+            max_concurrency: Maximum embedding requests in flight for batched calls
+                (if None, reads LAB_TUTOR_EMBED_CONCURRENCY, default 8)
+            max_retries: Retries per request on rate limits and transient errors
+                (if None, reads LAB_TUTOR_EMBED_MAX_RETRIES, default 5)
+            embedding_precision: How `embed_structured_document` stores embeddings:
+                "fp32" float lists (default), or "fp16"/"int8" base64 bytes (see `encode_embedding`)
         """
+        if embedding_precision not in EMBEDDING_PRECISIONS:
+            raise ValueError(f"embedding_precision must be one of {EMBEDDING_PRECISIONS}")
         if api_key is None:
             api_key = os.getenv("LAB_TUTOR_LLM_API_KEY")
             if api_key is None:
                 raise ValueError("API key must be provided either as parameter or LAB_TUTOR_LLM_API_KEY environment variable")
         
-        self.embeddings = OpenAIEmbeddings(
+        self.model = model
+        if batch_size is None:
+            batch_size = int(os.getenv("LAB_TUTOR_EMBED_BATCH_SIZE", "100"))
+        self.batch_size = max(1, batch_size)
+        if max_tokens_per_batch is None:
+            max_tokens_per_batch = int(os.getenv("LAB_TUTOR_EMBED_MAX_TOKENS", str(MAX_TOKENS_PER_REQUEST)))
+        self.max_tokens_per_batch = max(1, max_tokens_per_batch)
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("LAB_TUTOR_EMBED_CONCURRENCY", "8"))
+        self.max_concurrency = max(1, max_concurrency)
+        if max_retries is None:
+            max_retries = int(os.getenv("LAB_TUTOR_EMBED_MAX_RETRIES", "5"))
+        self.max_retries = max(0, max_retries)
+        self.embedding_precision = embedding_precision
+        # Long-lived keep-alive pools shared by every sync/async request of this service,
+        # sized for max_concurrency batches in flight
+        self._http_limits = httpx.Limits(
+            max_connections=max(64, 2 * self.max_concurrency),
+            max_keepalive_connections=max(32, self.max_concurrency)
+        )
+        self._http_client = httpx.Client(limits=self._http_limits, timeout=60.0)
+        # Retries are handled here (honoring Retry-After), not by the OpenAI client
+        self._embeddings_kwargs = dict(
             api_key=SecretStr(api_key),
             base_url=base_url,
-            model=model
+            model=model,
+            max_retries=0,
+            http_client=self._http_client
         )
+        self.embeddings = OpenAIEmbeddings(**self._embeddings_kwargs)
+        # The async pool's connections belong to the event loop that opened them, so
+        # each running loop gets its own, created lazily (see `_aembeddings`). The
+        # service is shared across threads that may each run a loop.
+        # Event loop -> (its httpx.AsyncClient, the OpenAIEmbeddings using it)
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+    
+    def _aembeddings(self) -> OpenAIEmbeddings:
+        """Embeddings client whose async pool is bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                http_async_client = httpx.AsyncClient(limits=self._http_limits, timeout=60.0)
+                entry = (
+                    http_async_client,
+                    OpenAIEmbeddings(**self._embeddings_kwargs, http_async_client=http_async_client)
+                )
+                self._async_clients[loop] = entry
+        return entry[1]
+    
+    def _release_async_clients(self) -> List[Awaitable[None]]:
+        """
+        Detach every async pool and close each one on the loop that owns it.
+
+        Returns the close coroutines for pools owned by the running loop, for the
+        caller to await. A pool whose loop is closed (or idle while another loop
+        runs) is just dropped.
+        """
+        with self._async_clients_lock:
+            entries = [(loop, client) for loop, (client, _) in self._async_clients.items()]
+            self._async_clients.clear()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        closing = []
+        for loop, client in entries:
+            if loop.is_closed():
+                continue
+            if loop is running:
+                closing.append(client.aclose())
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            elif running is None:
+                loop.run_until_complete(client.aclose())
+        return closing
+    
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._http_client.close()
+        for closing in self._release_async_clients():
+            # Called synchronously from inside the owning loop - finish the close there
+            asyncio.ensure_future(closing)
+    
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._http_client.close()
+        for closing in self._release_async_clients():
+            await closing
+    
+    def __enter__(self) -> "EmbeddingService":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "EmbeddingService":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def _with_retries(self, call: Callable[[], T]) -> T:
+        """Run an API call, retrying rate limits and transient errors with backoff."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return call()
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"Embedding request failed (attempt {attempt + 1}/{self.max_retries + 1}): {e}; retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    async def _awith_retries(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Async `_with_retries`."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await call()
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"Embedding request failed (attempt {attempt + 1}/{self.max_retries + 1}): {e}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
     
     def embed_text(self, text: str) -> List[float]:
         """
@@ -43,7 +300,7 @@ class EmbeddingService:
         Returns:
             List of float values representing the embedding
         """
-        return self.embeddings.embed_query(text)
+        return self._with_retries(lambda: self.embeddings.embed_query(text))
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
@@ -55,7 +312,107 @@ class EmbeddingService:
         Returns:
             List of embeddings, each as a list of float values
         """
-        return self.embeddings.embed_documents(texts)
+        return self._with_retries(lambda: self.embeddings.embed_documents(texts))
+    
+    def embed_batch(self, texts: List[str], batch_size: Optional[int] = None,
+                    max_tokens: Optional[int] = None) -> List[List[float]]:
+        """
+        Generate embeddings for many texts in packed API requests.
+
+        Consecutive texts are packed greedily into requests of at most
+        `batch_size` texts and `max_tokens` tokens, so each `input=[...]`
+        request stays under the provider's per-call limits with as few
+        round trips as possible. A single text over the token budget is sent
+        on its own (LangChain splits it). Up to `max_concurrency` requests run
+        at the same time. Repeated texts are sent once and share the result.
+
+        Args:
+            texts: List of input texts to embed
+            batch_size: Maximum number of texts per request (defaults to `self.batch_size`)
+            max_tokens: Maximum total tokens per request (defaults to `self.max_tokens_per_batch`)
+
+        Returns:
+            List of embeddings in the same order as `texts`
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        batches = self._pack_batches(unique_texts, batch_size or self.batch_size,
+                                     max_tokens or self.max_tokens_per_batch)
+        if len(batches) <= 1 or self.max_concurrency <= 1:
+            results = [self.embed_documents(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                results = list(executor.map(self.embed_documents, batches))
+        return self._fan_out(texts, unique_texts, results)
+
+    def embed_documents_np(self, texts: List[str], batch_size: Optional[int] = None,
+                           max_tokens: Optional[int] = None) -> np.ndarray:
+        """
+        Generate embeddings as one float32 matrix instead of nested float lists.
+
+        Args:
+            texts: List of input texts to embed
+            batch_size: Maximum number of texts per request (defaults to `self.batch_size`)
+            max_tokens: Maximum total tokens per request (defaults to `self.max_tokens_per_batch`)
+
+        Returns:
+            Array of shape (len(texts), dimensions), rows in the same order as `texts`
+        """
+        return np.asarray(self.embed_batch(texts, batch_size=batch_size, max_tokens=max_tokens), dtype=np.float32)
+
+    async def aembed_batch(self, texts: List[str], batch_size: Optional[int] = None,
+                           max_tokens: Optional[int] = None) -> List[List[float]]:
+        """
+        Asynchronously generate embeddings for many texts in packed API requests.
+
+        Texts are deduplicated and packed as in `embed_batch` and the batches
+        dispatched together, with at most `max_concurrency` requests in flight.
+
+        Args:
+            texts: List of input texts to embed
+            batch_size: Maximum number of texts per request (defaults to `self.batch_size`)
+            max_tokens: Maximum total tokens per request (defaults to `self.max_tokens_per_batch`)
+
+        Returns:
+            List of embeddings in the same order as `texts`
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.aembed_documents(batch)
+
+        unique_texts = list(dict.fromkeys(texts))
+        batches = self._pack_batches(unique_texts, batch_size or self.batch_size,
+                                     max_tokens or self.max_tokens_per_batch)
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        return self._fan_out(texts, unique_texts, results)
+
+    @staticmethod
+    def _fan_out(texts: List[str], unique_texts: List[str],
+                 results: List[List[List[float]]]) -> List[List[float]]:
+        """Map per-batch embeddings of the unique texts back onto every input position."""
+        unique_embeddings = [embedding for result in results for embedding in result]
+        if len(unique_texts) == len(texts):
+            return unique_embeddings
+        by_text = dict(zip(unique_texts, unique_embeddings))
+        return [by_text[text] for text in texts]
+
+    @staticmethod
+    def _pack_batches(texts: List[str], batch_size: int, max_tokens: int) -> List[List[str]]:
+        """Split texts, in order, into batches bounded by item count and total tokens."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if current and (len(current) >= batch_size or current_tokens + tokens > max_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
     
     async def aembed_text(self, text: str) -> List[float]:
         """
@@ -67,7 +424,7 @@ class EmbeddingService:
         Returns:
             List of float values representing the embedding
         """
-        return await self.embeddings.aembed_query(text)
+        return await self._awith_retries(lambda: self._aembeddings().aembed_query(text))
     
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
         """
@@ -79,9 +436,10 @@ class EmbeddingService:
         Returns:
             List of embeddings, each as a list of float values
         """
-        return await self.embeddings.aembed_documents(texts)
+        return await self._awith_retries(lambda: self._aembeddings().aembed_documents(texts))
     
-    def embed_structured_document(self, json_file_path: str, output_file_path: Optional[str] = None) -> Dict[str, Any]:
+    def embed_structured_document(self, json_file_path: str, output_file_path: Optional[str] = None,
+                                  sidecar: Union[bool, str] = False) -> Dict[str, Any]:
         """
         Load a structured JSON document, generate embeddings for Topic summaries and Concept definitions,
         and return the updated document with embeddings added.
@@ -89,37 +447,179 @@ class EmbeddingService:
         Args:
             json_file_path: Path to the input JSON file containing the structured document
             output_file_path: Optional path to save the updated JSON file with embeddings
+            sidecar: Where the embeddings go instead of inline `embedding` fields (see `SIDECAR_FORMATS`):
+                True/"jsonl" writes only `{"id", "embedding"}` lines to `*.embeddings.jsonl` and leaves
+                the document unwritten; "npz" writes the float matrix and node ids to a compressed
+                `*.embeddings.npz` (read it with `load_embeddings_npz`) and saves the document with
+                an `embedding_ref` (the node id) on each embedded node
             
         Returns:
             Dictionary containing the updated document structure with embeddings
+            (encoded per `embedding_precision`; read them back with `decode_embedding`)
         """
-        # Load the JSON file
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        sidecar_format = self._sidecar_format(sidecar)
+        data = self._load_structured_document(json_file_path)
+        texts_to_embed, node_indices = self._collect_texts_to_embed(data)
         
-        # Extract texts to embed and track their corresponding nodes
-        texts_to_embed = []
-        node_indices = []
+        # Generate embeddings in as few token-budgeted requests as possible; quantized
+        # precisions and the npz sidecar work on one float32 matrix, fp32 keeps the API's float lists
+        embeddings = None
+        if texts_to_embed:
+            if self.embedding_precision == "fp32" and sidecar_format != "npz":
+                embeddings = self.embed_batch(texts_to_embed)
+            else:
+                embeddings = self.embed_documents_np(texts_to_embed)
+            self._attach_embeddings(data, embeddings, node_indices, sidecar_format)
         
-        for i, node in enumerate(data.get('nodes', [])):
-            if node.get('type') == 'Topic' and 'summary' in node:
-                texts_to_embed.append(node['summary'])
-                node_indices.append(i)
-            elif node.get('type') == 'Concept' and 'definition' in node:
-                texts_to_embed.append(node['definition'])
-                node_indices.append(i)
+        if output_file_path:
+            self._save_outputs(data, embeddings, node_indices, output_file_path, sidecar_format)
         
-        # Generate embeddings for all texts at once (more efficient)
-        if texts_to_embed:
-            embeddings = self.embed_documents(texts_to_embed)
+        return data
+    
+    async def aembed_structured_document(self, json_file_path: str, output_file_path: Optional[str] = None,
+                                        sidecar: Union[bool, str] = False) -> Dict[str, Any]:
+        """
+        Asynchronous `embed_structured_document`: all embedding requests are
+        dispatched concurrently (at most `max_concurrency` in flight), and file
+        I/O runs on worker threads so the event loop is never blocked.
+        
+        Args:
+            json_file_path: Path to the input JSON file containing the structured document
+            output_file_path: Optional path to save the updated JSON file with embeddings
+            sidecar: Where the embeddings go instead of inline fields (see `embed_structured_document`)
             
-            # Add embeddings back to the corresponding nodes
-            for embedding, node_idx in zip(embeddings, node_indices):
-                data['nodes'][node_idx]['embedding'] = embedding
+        Returns:
+            Dictionary containing the updated document structure with embeddings
+        """
+        sidecar_format = self._sidecar_format(sidecar)
+        data = await asyncio.to_thread(self._load_structured_document, json_file_path)
+        texts_to_embed, node_indices = self._collect_texts_to_embed(data)
+        
+        embeddings = None
+        if texts_to_embed:
+            embeddings = await self.aembed_batch(texts_to_embed)
+            self._attach_embeddings(data, embeddings, node_indices, sidecar_format)
         
-        # Save to output file if specified
         if output_file_path:
-            with open(output_file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._save_outputs, data, embeddings, node_indices,
+                                    output_file_path, sidecar_format)
+        
+        return data
+    
+    @staticmethod
+    def _sidecar_format(sidecar: Union[bool, str]) -> Optional[str]:
+        """Normalize the `sidecar` argument to None or one of `SIDECAR_FORMATS`."""
+        if sidecar is True:
+            return "jsonl"
+        if not sidecar:
+            return None
+        if sidecar not in SIDECAR_FORMATS:
+            raise ValueError(f"Unknown sidecar format: {sidecar!r} (expected one of {SIDECAR_FORMATS})")
+        return sidecar
+    
+    def _attach_embeddings(self, data: Dict[str, Any], embeddings: Union[List[List[float]], np.ndarray],
+                           node_indices: List[int], sidecar_format: Optional[str]) -> None:
+        """Add the embeddings (or, for the npz sidecar, references to them) back to their nodes."""
+        nodes = data['nodes']
+        if sidecar_format == "npz":
+            for node_idx in node_indices:
+                nodes[node_idx]['embedding_ref'] = nodes[node_idx].get('id')
+            return
+        for encoded, node_idx in zip(encode_embeddings(embeddings, self.embedding_precision), node_indices):
+            nodes[node_idx]['embedding'] = encoded
+    
+    def _save_outputs(self, data: Dict[str, Any], embeddings: Optional[Union[List[List[float]], np.ndarray]],
+                      node_indices: List[int], output_file_path: str, sidecar_format: Optional[str]) -> None:
+        """Write the document and/or its embedding sidecar for `output_file_path`."""
+        if sidecar_format == "jsonl":
+            self._save_embeddings_sidecar(data, node_indices, output_file_path)
+            return
+        if sidecar_format == "npz" and embeddings is not None:
+            dtype = np.float16 if self.embedding_precision == "fp16" else np.float32
+            ids = np.array([str(data['nodes'][node_idx].get('id')) for node_idx in node_indices])
+            np.savez_compressed(self.sidecar_path(output_file_path, "npz"),
+                                ids=ids, embeddings=np.asarray(embeddings, dtype=dtype))
+        self._save_structured_document(data, output_file_path)
+    
+    def embed_many(self, paths: List[str], out_dir: str, max_workers: int = 4,
+                   sidecar: Union[bool, str] = False) -> Dict[str, Any]:
+        """
+        Run `embed_structured_document` over many files on a bounded thread pool,
+        overlapping the per-file request latency.
+        
+        Args:
+            paths: Input JSON files
+            out_dir: Directory for the outputs (same file names as the inputs)
+            max_workers: Number of files embedded at once
+            sidecar: Passed through to `embed_structured_document`
+            
+        Returns:
+            Dictionary with the `successful` output paths and the `failed` inputs with their errors
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        results = {'successful': [], 'failed': []}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {}
+            for path in paths:
+                out_path = os.path.join(out_dir, os.path.basename(path))
+                futures[executor.submit(self.embed_structured_document, path, out_path, sidecar)] = (path, out_path)
+            for future in as_completed(futures):
+                path, out_path = futures[future]
+                try:
+                    future.result()
+                    results['successful'].append(out_path)
+                except Exception as e:
+                    logger.error(f"Failed to embed {path}: {e}")
+                    results['failed'].append({'file': path, 'error': str(e)})
+        return results
+    
+    @staticmethod
+    def _load_structured_document(json_file_path: str) -> Dict[str, Any]:
+        """Load a structured JSON document (orjson parses the raw bytes much faster)."""
+        with open(json_file_path, 'rb') as file:
+            return orjson.loads(file.read())
+    
+    @staticmethod
+    def _collect_texts_to_embed(data: Dict[str, Any]) -> Tuple[List[str], List[int]]:
+        """Topic summaries and Concept definitions to embed, with the indices of their nodes."""
+        texts_to_embed = []
+        node_indices = []
+        # One type lookup per node, with the lookups bound to locals
+        add_text = texts_to_embed.append
+        add_index = node_indices.append
+        get = dict.get
         
-        return data
\ No newline at end of file
+        for i, node in enumerate(data.get('nodes') or []):
+            node_type = get(node, 'type')
+            if node_type == 'Topic':
+                text = get(node, 'summary')
+            elif node_type == 'Concept':
+                text = get(node, 'definition')
+            else:
+                continue
+            if text is not None:
+                add_text(text)
+                add_index(i)
+        
+        return texts_to_embed, node_indices
+    
+    @staticmethod
+    def _save_structured_document(data: Dict[str, Any], output_file_path: str) -> None:
+        """Save the updated document as indented JSON (orjson writes the float-heavy output much faster)."""
+        with open(output_file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    
+    @staticmethod
+    def sidecar_path(output_file_path: str, sidecar_format: str = "jsonl") -> str:
+        """Path of the `*.embeddings.<format>` sidecar that belongs to an output JSON path."""
+        path = Path(output_file_path)
+        return str(path.with_name(f"{path.stem}.embeddings.{sidecar_format}"))
+    
+    @classmethod
+    def _save_embeddings_sidecar(cls, data: Dict[str, Any], node_indices: List[int], output_file_path: str) -> None:
+        """Write one `{"id", "embedding"}` JSON line per embedded node, leaving the document itself alone."""
+        nodes = data['nodes']
+        with open(cls.sidecar_path(output_file_path), 'wb') as file:
+            for node_idx in node_indices:
+                record = {"id": nodes[node_idx].get('id'), "embedding": nodes[node_idx]['embedding']}
+                file.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
@@ -0,0 +1,252 @@
+"""
+Persistent embedding cache.
+
+Concept definitions and document summaries recur heavily across re-runs of the
+extraction/ingestion scripts, so embeddings are cached on disk keyed by
+sha256(model + text). A second, normalized key lets copies that differ only in
+case, spacing or trailing punctuation reuse each other's vector when the exact
+text has no entry. Vectors are stored as float16 bytes in SQLite, with an LRU
+bound on the number of rows and a TTL on their age.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from .embedding import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "lab_tutor" / "embeddings.sqlite3"
+
+# Hits are re-stamped for LRU order at most this often (seconds), so most reads
+# never take the write lock that parallel extraction processes share
+TOUCH_INTERVAL = 3600
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s.,;:!?]+$")
+
+
+class LRUEmbeddingCache:
+    """SQLite-backed embedding cache with LRU eviction and a TTL."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        capacity: int = 10_000,
+        ttl: int = 7 * 86400,
+        normalize_keys: bool = True
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file (defaults to LAB_TUTOR_EMBEDDING_CACHE env var or
+                ~/.cache/lab_tutor/embeddings.sqlite3)
+            capacity: Maximum number of cached vectors; least recently used are evicted
+            ttl: Seconds after which an entry is treated as a miss
+            normalize_keys: On an exact-key miss, fall back to a key on case-folded text
+                with collapsed whitespace and no trailing punctuation; False only
+                matches the exact (stripped) text
+        """
+        self.path = Path(path or os.getenv("LAB_TUTOR_EMBEDDING_CACHE", DEFAULT_CACHE_PATH))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.ttl = ttl
+        self.normalize_keys = normalize_keys
+
+        # Embeddings are requested from worker threads during JSON ingestion
+        self._lock = threading.Lock()
+        # WAL lets other processes read while one writes; writers wait up to 30s for the lock
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache("
+            "hash BLOB PRIMARY KEY, model TEXT, vec BLOB, ts INTEGER)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache(ts)")
+        self._conn.commit()
+        # Upper bound on the row count; recounted only once it passes capacity
+        self._rows = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def make_key(self, model: str, text: str) -> bytes:
+        """Cache key for a text embedded with a given model."""
+        return hashlib.sha256((model + "\x00" + text.strip()).encode("utf-8")).digest()
+
+    def make_normalized_key(self, model: str, text: str) -> Optional[bytes]:
+        """Second-tier key shared by texts that differ only in case, spacing or
+        trailing punctuation (None when `normalize_keys` is off)."""
+        if not self.normalize_keys:
+            return None
+        text = _TRAILING_PUNCT_RE.sub("", _WHITESPACE_RE.sub(" ", text.strip().casefold()))
+        # Separate namespace so a normalized entry never answers an exact lookup
+        return hashlib.sha256((model + "\x01" + text).encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[List[float]]]:
+        """Look up several keys; misses and expired entries come back as None."""
+        if not keys:
+            return []
+        now = int(time.time())
+        rows = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.update(
+                    (key, (vec, ts)) for key, vec, ts in self._conn.execute(
+                        f"SELECT hash, vec, ts FROM cache WHERE hash IN ({placeholders}) AND ts >= ?",
+                        (*chunk, now - self.ttl)
+                    )
+                )
+            stale = [key for key, (_, ts) in rows.items() if ts < now - TOUCH_INTERVAL]
+            if stale:
+                # Touch hits so eviction stays least-recently-used
+                self._conn.executemany(
+                    "UPDATE cache SET ts = ? WHERE hash = ?",
+                    [(now, key) for key in stale]
+                )
+                self._conn.commit()
+        return [
+            np.frombuffer(rows[key][0], dtype=np.float16).astype(np.float32).tolist()
+            if key in rows else None
+            for key in keys
+        ]
+
+    def put_many(self, model: str, items: List[tuple]) -> None:
+        """Store (key, vector) pairs, evicting the oldest rows once there are more than capacity."""
+        if not items:
+            return
+        now = int(time.time())
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache(hash, model, vec, ts) VALUES (?, ?, ?, ?)",
+                [
+                    (key, model, np.asarray(vec, dtype=np.float16).tobytes(), now)
+                    for key, vec in items
+                ]
+            )
+            self._rows += len(items)
+            if self._rows > self.capacity:
+                self._rows = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+                if self._rows > self.capacity:
+                    self._conn.execute(
+                        "DELETE FROM cache WHERE hash IN ("
+                        "SELECT hash FROM cache ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                        (self.capacity,)
+                    )
+                    self._rows = self.capacity
+            self._conn.commit()
+
+
+class CachedEmbedder(EmbeddingService):
+    """EmbeddingService that consults an LRUEmbeddingCache before calling the API."""
+
+    def __init__(self, cache: Optional[LRUEmbeddingCache] = None, **kwargs):
+        """
+        Args:
+            cache: Cache to use (a default LRUEmbeddingCache when omitted)
+            **kwargs: Passed through to EmbeddingService
+        """
+        super().__init__(**kwargs)
+        self.cache = cache or LRUEmbeddingCache()
+        # Texts served from the cache vs. sent to the API (duplicates in one call count once)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()
+
+    def embed_text(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        embeddings, misses = self._lookup(texts)
+        if misses:
+            fresh = super().embed_documents([texts[indices[0]] for indices in misses.values()])
+            self._fill(texts, embeddings, misses, fresh)
+        return embeddings
+
+    async def aembed_text(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        # SQLite reads/writes run on worker threads to keep the event loop free
+        embeddings, misses = await asyncio.to_thread(self._lookup, texts)
+        if misses:
+            fresh = await super().aembed_documents([texts[indices[0]] for indices in misses.values()])
+            await asyncio.to_thread(self._fill, texts, embeddings, misses, fresh)
+        return embeddings
+
+    def _lookup(self, texts: List[str]) -> tuple:
+        """
+        Cached embeddings (None for misses) and the miss positions grouped by key.
+
+        A cache that cannot be read (e.g. locked by another process for too
+        long) counts as a miss for every text.
+        """
+        keys = [self.cache.make_key(self.model, text) for text in texts]
+        try:
+            embeddings = self.cache.get_many(keys)
+
+            # Second tier: texts without an exact entry may match a normalized one
+            fallback = [
+                (i, self.cache.make_normalized_key(self.model, texts[i]))
+                for i, embedding in enumerate(embeddings) if embedding is None
+            ]
+            fallback = [(i, key) for i, key in fallback if key is not None]
+            if fallback:
+                found = self.cache.get_many([key for _, key in fallback])
+                for (i, _), embedding in zip(fallback, found):
+                    embeddings[i] = embedding
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed, treating as misses: {e}")
+            embeddings = [None] * len(texts)
+
+        # Group misses by key so repeated texts are only sent once
+        misses = {}
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                misses.setdefault(keys[i], []).append(i)
+
+        with self._stats_lock:
+            self.cache_hits += len(texts) - sum(len(indices) for indices in misses.values())
+            self.cache_misses += len(misses)
+
+        return embeddings, misses
+
+    def _fill(self, texts: List[str], embeddings: List, misses: dict, fresh: List[List[float]]) -> None:
+        """Place freshly computed embeddings at their miss positions and cache them
+        under both their exact and normalized keys."""
+        items = []
+        for (key, indices), embedding in zip(misses.items(), fresh):
+            for i in indices:
+                embeddings[i] = embedding
+            items.append((key, embedding))
+            normalized_key = self.cache.make_normalized_key(self.model, texts[indices[0]])
+            if normalized_key is not None:
+                items.append((normalized_key, embedding))
+        try:
+            self.cache.put_many(self.model, items)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache update failed, not caching {len(misses)} vectors: {e}")
+
+
+_cached_embedder: Optional[CachedEmbedder] = None
+_cached_embedder_lock = threading.Lock()
+
+
+def get_cached_embedder() -> CachedEmbedder:
+    """Process-wide CachedEmbedder with the default configuration."""
+    global _cached_embedder
+    with _cached_embedder_lock:
+        if _cached_embedder is None:
+            _cached_embedder = CachedEmbedder()
+        return _cached_embedder
@@ -5,19 +5,28 @@ This service implements an advanced iterative workflow for concept relationship
 with comprehensive quality scoring, state history tracking, and sophisticated convergence logic.
 """
 
+import asyncio
 import os
-import json
+import sys
 import time
 import logging
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from pathlib import Path
+from typing import List, Dict, Mapping, Optional, Any
 from dotenv import load_dotenv
 
+import orjson
+
 # LangSmith tracing is now enabled (token limit was the issue, not LangSmith)
 # If you see "keys must be str, int..." errors, it's just logging - workflow still works
 
 # LangChain and LangGraph imports
+from langchain_community.cache import SQLiteCache
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+from openai import BadRequestError, LengthFinishReasonError
 from pydantic import SecretStr
 from langgraph.graph import StateGraph, END
 
@@ -42,10 +51,16 @@ from models.langgraph_state_models import (
 )
 from prompts.enhanced_relationship_prompts import (
     BINARY_VALIDATION_PROMPT,
-    BINARY_GENERATION_PROMPT
+    BINARY_GENERATION_PROMPT,
+    BINARY_GENERATION_CONCEPTS_TEMPLATE,
+    BINARY_GENERATION_WEAK_PATTERNS_TEMPLATE,
+    build_relationship_type_codes,
+    build_relationship_types_desc
 )
 from prompts.concept_normalization_prompts import (
     CONCEPT_NORMALIZATION_PROMPT,
+    CONCEPT_NORMALIZATION_CONCEPTS_TEMPLATE,
+    CONCEPT_NORMALIZATION_WEAK_MERGES_TEMPLATE,
     MERGE_VALIDATION_PROMPT
 )
 
@@ -53,6 +68,35 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LLM_CACHE_PATH = Path.home() / ".cache" / "lab_tutor" / "llm_responses.sqlite3"
+
+# Output token budget: the hard cap, plus the estimate used to size later calls
+# from the largest batch seen so far (one structured item is ~120 tokens)
+MAX_COMPLETION_TOKENS = 8192
+MIN_COMPLETION_TOKENS = 1024
+TOKENS_PER_OUTPUT_ITEM = 120
+
+
+class PrerenderedPrompt:
+    """
+    A generation prompt rendered once per run except for its trailing weak-items block.
+    
+    `format_messages` only fills the small tail template and concatenates it, so
+    each iteration skips the template engine for the (large) concept list while
+    producing the same messages as the full `ChatPromptTemplate`.
+    """
+    
+    def __init__(self, system_message: SystemMessage, human_prefix: str, tail_template: str):
+        self.system_message = system_message
+        self.human_prefix = human_prefix
+        self.tail_template = tail_template
+    
+    def format_messages(self, **kwargs: Any) -> List[BaseMessage]:
+        return [
+            self.system_message,
+            HumanMessage(content=self.human_prefix + self.tail_template.format(**kwargs))
+        ]
+
 
 class EnhancedRelationshipService:
     """
@@ -70,7 +114,8 @@ class EnhancedRelationshipService:
         self,
         neo4j_service: Neo4jService,
         config: WorkflowConfiguration,
-        model_id: str = "gpt-4o-2024-08-06"
+        model_id: str = "gpt-4o-2024-08-06",
+        use_llm_cache: bool = True
     ):
         """
         Initialize the EnhancedRelationshipService.
@@ -79,6 +124,8 @@ class EnhancedRelationshipService:
             neo4j_service: Neo4j service for graph operations
             config: Workflow configuration with quality thresholds and parameters
             model_id: LLM model identifier
+            use_llm_cache: Reuse responses to identical prompts from a persistent SQLite cache
+                (LAB_TUTOR_LLM_CACHE env var or ~/.cache/lab_tutor/llm_responses.sqlite3)
         """
         load_dotenv()
         
@@ -87,10 +134,37 @@ class EnhancedRelationshipService:
         self.model_id = model_id
         self.relationship_types = config.relationship_types
         self.relationship_type_names = list(config.relationship_types.keys())
+        # The generator emits single-letter codes in `rel` (code -> full type name)
+        self.relationship_type_codes = build_relationship_type_codes(self.relationship_types)
+
+        # Relationship types never change during a run - bake them into the system
+        # messages once so every call shares an identical, fully static prefix
+        self.relationship_types_desc = build_relationship_types_desc(
+            self.relationship_types, self.relationship_type_codes
+        )
+        example_code, example_type = next(iter(self.relationship_type_codes.items()))
+        self.generation_system_message = BINARY_GENERATION_PROMPT.messages[0].format(
+            relationship_types_desc=self.relationship_types_desc,
+            example_code=example_code,
+            example_type=example_type
+        )
+        self.merge_system_message = CONCEPT_NORMALIZATION_PROMPT.messages[0].format()
+        self.validation_prompt = BINARY_VALIDATION_PROMPT.partial(
+            relationship_types=", ".join(self.relationship_type_names)
+        )
         
         # Create debug output directory for iteration logging
         self.debug_dir = "iteration_logs"
-        os.makedirs(self.debug_dir, exist_ok=True)
+        if config.debug_dump_iterations:
+            os.makedirs(self.debug_dir, exist_ok=True)
+        # Single writer thread for those logs while `detect_relationships` runs
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Shared pool for blocking Neo4j lookups made from the async nodes
+        self._neo4j_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="neo4j")
+        # Concept name -> definitions (or the pending lookup), filled as batches need them (reset per run)
+        self._definition_cache: Dict[str, Any] = {}
+        # Concept name -> its rendered definitions block for the validation prompts
+        self._definition_blocks: Dict[str, str] = {}
         
         # Initialize LLM
         self.api_key = os.getenv("LAB_TUTOR_LLM_API_KEY") or os.getenv("OPENAI_API_KEY")
@@ -105,29 +179,40 @@ class EnhancedRelationshipService:
                 "LAB_TUTOR_LLM_API_KEY (or OPENAI_API_KEY) environment variable is required"
             )
         
+        # Prompts are deterministic (sorted weak patterns, temperature 0), so a repeated
+        # prompt within or across runs is answered from disk instead of the API
+        llm_cache = None
+        if use_llm_cache:
+            llm_cache_path = Path(os.getenv("LAB_TUTOR_LLM_CACHE", DEFAULT_LLM_CACHE_PATH))
+            llm_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            llm_cache = SQLiteCache(database_path=str(llm_cache_path))
+        
         self.llm = ChatOpenAI(
             model=model_id,
             base_url=self.api_base,
             api_key=SecretStr(self.api_key),
             temperature=0,
             timeout=600,  # 10 minutes timeout to prevent indefinite hanging
-            max_completion_tokens=8192  # Allow longer outputs for relationship generation
+            max_completion_tokens=MAX_COMPLETION_TOKENS,  # Allow longer outputs for relationship generation
+            cache=llm_cache
         )
 
         # Use structured output to force proper JSON formatting
-        # For GPT-4o through proxy API, use json_mode to avoid parsing issues
-        if "gpt-4o" in model_id:
-            # Use json_mode for GPT-4o (more compatible with proxy APIs)
-            self.relationship_chain = self.llm.with_structured_output(RelationshipBatch, method="json_mode")
-            self.validation_chain = self.llm.with_structured_output(ValidationFeedback, method="json_mode")
-            self.merge_chain = self.llm.with_structured_output(MergeBatch, method="json_mode")
-            self.merge_validation_chain = self.llm.with_structured_output(MergeValidationFeedback, method="json_mode")
-        else:
-            # Use default function_calling for other models (DeepSeek, etc.)
-            self.relationship_chain = self.llm.with_structured_output(RelationshipBatch)
-            self.validation_chain = self.llm.with_structured_output(ValidationFeedback)
-            self.merge_chain = self.llm.with_structured_output(MergeBatch)
-            self.merge_validation_chain = self.llm.with_structured_output(MergeValidationFeedback)
+        self.relationship_chain = self._structured_chain(RelationshipBatch)
+        self.validation_chain = self._structured_chain(ValidationFeedback)
+        self.merge_chain = self._structured_chain(MergeBatch)
+        self.merge_validation_chain = self._structured_chain(MergeValidationFeedback)
+        
+        # Generation chains with a smaller output budget, keyed by (schema, budget);
+        # budgets follow the largest batch each generator has returned this run
+        self._budgeted_chains = {
+            (RelationshipBatch, MAX_COMPLETION_TOKENS): self.relationship_chain,
+            (MergeBatch, MAX_COMPLETION_TOKENS): self.merge_chain,
+        }
+        self._largest_output = {}
+        # Generators whose reduced budget truncated a response; they keep the full cap
+        self._full_budget = set()
+        self._initial_budget = {RelationshipBatch: MAX_COMPLETION_TOKENS, MergeBatch: 2048}
         
         # Compile LangGraph workflow
         self.workflow = self._create_workflow()
@@ -135,7 +220,78 @@ class EnhancedRelationshipService:
         if self.config.verbose_logging:
             logger.info(f"EnhancedRelationshipService initialized - Model: {model_id}, Max iterations: {config.max_iterations}")
     
-    def _create_workflow(self):
+    def _structured_chain(self, schema, llm=None):
+        """
+        Bind the LLM to return `schema` instances.
+        
+        GPT-4o uses strict JSON-schema decoding, so responses always match the model
+        and never go through JSON repair; a proxy that rejects `response_format`
+        schemas (400) falls back to function calling. Other models (DeepSeek, etc.)
+        keep the langchain default method.
+        """
+        llm = llm or self.llm
+        if "gpt-4o" not in self.model_id:
+            return llm.with_structured_output(schema)
+        return llm.with_structured_output(schema, method="json_schema", strict=True).with_fallbacks(
+            [llm.with_structured_output(schema, method="function_calling")],
+            exceptions_to_handle=(BadRequestError,)
+        )
+    
+    def _output_budget(self, schema) -> int:
+        """
+        Output token budget for the next `schema` generation call.
+        
+        The first call uses the initial budget; afterwards it is 1.5x the largest
+        batch seen, rounded up to a multiple of 1024 so cached prompts keep
+        hitting the same LLM-cache key. Once a reduced budget has truncated a
+        response, the generator stays at the full cap for the rest of the run.
+        """
+        if schema in self._full_budget:
+            return MAX_COMPLETION_TOKENS
+        largest = self._largest_output.get(schema)
+        if largest is None:
+            return self._initial_budget.get(schema, MAX_COMPLETION_TOKENS)
+        estimate = TOKENS_PER_OUTPUT_ITEM * (largest * 3 // 2 + 1)
+        rounded = -(-estimate // MIN_COMPLETION_TOKENS) * MIN_COMPLETION_TOKENS
+        return min(MAX_COMPLETION_TOKENS, max(MIN_COMPLETION_TOKENS, rounded))
+    
+    def _budgeted_chain(self, schema, budget: int):
+        """Structured-output chain for `schema` whose LLM is capped at `budget` output tokens."""
+        key = (schema, budget)
+        chain = self._budgeted_chains.get(key)
+        if chain is None:
+            # Runtime config does not reach the model through `with_structured_output`,
+            # so each budget gets its own model copy
+            llm = self.llm.model_copy(update={"max_tokens": budget})
+            chain = self._budgeted_chains[key] = self._structured_chain(schema, llm)
+        return chain
+    
+    async def _invoke_generation(self, schema, messages):
+        """
+        Run a `schema` generation call under its output budget.
+        
+        A response cut off by a reduced budget fails to parse; the same call is
+        then retried once with the full cap instead of losing the batch.
+        """
+        budget = self._output_budget(schema)
+        try:
+            return await self._budgeted_chain(schema, budget).ainvoke(messages)
+        except (LengthFinishReasonError, ValueError) as e:
+            # ValueError covers the parser failures (OutputParserException, ValidationError)
+            if budget >= MAX_COMPLETION_TOKENS:
+                raise
+            logger.warning(
+                "%s output did not fit in %d tokens (%s) - retrying with %d",
+                schema.__name__, budget, type(e).__name__, MAX_COMPLETION_TOKENS
+            )
+            self._full_budget.add(schema)
+            return await self._budgeted_chain(schema, MAX_COMPLETION_TOKENS).ainvoke(messages)
+    
+    def _record_output(self, schema, count: int):
+        """Track the largest batch each generator has returned, for `_output_budget`."""
+        self._largest_output[schema] = max(self._largest_output.get(schema, 0), count)
+    
+    def _create_workflow(self, checkpointer=None):
         """
         Create and compile the enhanced LangGraph workflow.
         
@@ -145,6 +301,9 @@ class EnhancedRelationshipService:
         3. Validation → Convergence Checker
         4. Convergence → Either continue (back to Generation) or END
         
+        Args:
+            checkpointer: Optional LangGraph checkpointer that persists state after every node
+        
         Returns:
             Compiled StateGraph workflow
         """
@@ -169,7 +328,7 @@ class EnhancedRelationshipService:
             }
         )
         
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
     
     def detect_relationships(
         self,
@@ -199,6 +358,11 @@ class EnhancedRelationshipService:
         
         # Get all concepts
         concepts = self._get_all_concepts()
+        self._bind_concepts(concepts)
+        self._definition_cache = {}
+        self._definition_blocks = {}
+        self._largest_output = {}
+        self._full_budget = set()
         
         if self.config.verbose_logging:
             print(f"Total concepts: {len(concepts)}")
@@ -230,8 +394,16 @@ class EnhancedRelationshipService:
             }
         }
         
-        # Execute workflow
-        final_state = self.workflow.invoke(initial_state,{'recursion_limit':100})
+        # Execute workflow (async, so independent LLM calls within a node overlap);
+        # iteration logs are written in the background and flushed before returning
+        if self.config.debug_dump_iterations:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iteration-log")
+        try:
+            final_state = asyncio.run(self._run_workflow(initial_state, thread_id=langsmith_run_name))
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
         
         # Extract results (convert dict to list)
         relationships = list(final_state["all_relationships"].values())
@@ -253,10 +425,97 @@ class EnhancedRelationshipService:
         
         return relationships, output_path, workflow_stats
     
+    async def _run_workflow(self, initial_state: EnhancedRelationshipState, thread_id: str) -> Dict[str, Any]:
+        """
+        Run the workflow, checkpointing to `config.checkpoint_path` when set.
+        
+        With a checkpoint database, state is saved after every node under `thread_id`;
+        if the previous run for that thread stopped part-way (crash, timeout), it is
+        resumed from its last completed node instead of starting over.
+        """
+        run_config = {'recursion_limit': 100}
+        if not self.config.checkpoint_path:
+            return await self.workflow.ainvoke(initial_state, run_config)
+        
+        import aiosqlite
+        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        
+        # State holds these pydantic models; allow them explicitly when restoring
+        serde = JsonPlusSerializer(allowed_msgpack_modules=[
+            (model.__module__, model.__name__)
+            for model in (ConceptMerge, ConceptRelationship, ConvergenceMetrics, IterationSnapshot,
+                          MergeValidationFeedback, ValidationFeedback, WeakMerge, WeakRelationship)
+        ])
+        
+        run_config["configurable"] = {"thread_id": thread_id}
+        async with aiosqlite.connect(self.config.checkpoint_path) as conn:
+            checkpointer = AsyncSqliteSaver(conn, serde=serde)
+            workflow = self._create_workflow(checkpointer=checkpointer)
+            snapshot = await workflow.aget_state(run_config)
+            if snapshot.next:
+                logger.info(f"Resuming '{thread_id}' from checkpoint at iteration {snapshot.values['iteration_count'] + 1}")
+                return await workflow.ainvoke(None, run_config)
+            return await workflow.ainvoke(initial_state, run_config)
+    
     def _get_all_concepts(self) -> List[Dict[str, str]]:
-        """Get all concepts from Neo4j."""
-        return self.neo4j_service.get_all_concepts()
+        """
+        Get all concepts from Neo4j, sorted by name.
+        
+        The concept list opens every generation prompt, so a fixed order keeps that
+        prefix byte-identical across iterations and runs (provider prefix caching).
+        Names are interned since they are the building blocks of every state key.
+        """
+        concepts = sorted(self.neo4j_service.get_all_concepts(), key=lambda c: c['name'])
+        for concept in concepts:
+            concept['name'] = sys.intern(concept['name'])
+        return concepts
 
+    def _bind_concepts(self, concepts: List[Dict[str, str]]) -> None:
+        """
+        Render both generation prompts once per run, up to their weak-items block.
+        
+        The concepts never change between iterations, so only the weak-pattern
+        variables are left to fill in per call.
+        """
+        self.concept_generation_prompts = [
+            PrerenderedPrompt(
+                self.generation_system_message,
+                BINARY_GENERATION_CONCEPTS_TEMPLATE.format(
+                    num_concepts=len(shard),
+                    concept_list="\n".join(f"- {c['name']}" for c in shard),
+                    relationship_types_desc=self.relationship_types_desc
+                ),
+                BINARY_GENERATION_WEAK_PATTERNS_TEMPLATE
+            )
+            for shard in self._concept_shards(concepts)
+        ]
+        # Synonyms can sit anywhere in the sorted list ("ml" vs "machine learning"),
+        # so merge detection always sees every concept in one prompt
+        self.concept_merge_prompt = PrerenderedPrompt(
+            self.merge_system_message,
+            CONCEPT_NORMALIZATION_CONCEPTS_TEMPLATE.format(
+                num_concepts=len(concepts),
+                concept_list="\n".join(f"- {c['name']}" for c in concepts)
+            ),
+            CONCEPT_NORMALIZATION_WEAK_MERGES_TEMPLATE
+        )
+    
+    def _concept_shards(self, concepts: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+        """Split concepts into overlapping windows of `generation_shard_size` (one window when unset)."""
+        shard_size = self.config.generation_shard_size
+        if not shard_size or len(concepts) <= shard_size:
+            return [concepts]
+        
+        # Overlap is capped at half a shard so the windows always advance
+        stride = shard_size - min(self.config.generation_shard_overlap, shard_size // 2)
+        shards = []
+        for start in range(0, len(concepts), stride):
+            shards.append(concepts[start:start + shard_size])
+            if start + shard_size >= len(concepts):
+                break
+        return shards
+    
     def _log_prompt_length(self, messages, context: str = ""):
         """
         Log the length of prompts being sent to LLM.
@@ -305,11 +564,11 @@ class EnhancedRelationshipService:
         if len(breakdown) > 1:
             print(f"      {', '.join(breakdown)}")
     
-    def _generation_node(self, state: EnhancedRelationshipState) -> EnhancedRelationshipState:
+    async def _generation_node(self, state: EnhancedRelationshipState) -> Dict[str, Any]:
         """
         Generation node: Generate merges AND relationships with smart LLM calling.
         
-        Makes two LLM calls:
+        Makes two independent LLM calls concurrently:
         1. Find similar concepts (if not converged)
         2. Generate relationships (if not converged)
         """
@@ -317,58 +576,61 @@ class EnhancedRelationshipService:
         concepts = state["concepts"]
 
         if self.config.verbose_logging:
-            logger.info(f"ITERATION {iteration + 1}/{state['max_iterations']} - Generation Phase - Concepts: {len(concepts)}")
+            logger.info("ITERATION %d/%d - Generation Phase - Concepts: %d", iteration + 1, state['max_iterations'], len(concepts))
 
         # Get convergence status from metrics
         metrics = state["convergence_metrics"]
         merges_converged = metrics.merges_converged
         relationships_converged = metrics.relationships_converged
         
+        async def skipped() -> list:
+            return []
+        
         # === LLM CALL 1: Find Similar Concepts (if not converged) ===
-        new_merges = []
         if not merges_converged:
             if self.config.verbose_logging:
-                logger.debug(f"Finding similar concepts - Weak merge patterns to avoid: {len(state['weak_merges'])}")
+                logger.debug("Finding similar concepts - Weak merge patterns to avoid: %d", len(state['weak_merges']))
             
-            new_merges = self._find_similar_concepts(
-                concepts=concepts,
-                weak_merges=state["weak_merges"]
-            )
-            
-            if self.config.verbose_logging:
-                logger.info(f"Found {len(new_merges)} merge proposals")
+            merge_call = self._find_similar_concepts(weak_merges=state["weak_merges"])
         else:
             if self.config.verbose_logging:
                 logger.info("Merge detection converged - skipping")
+            merge_call = skipped()
         
         # === LLM CALL 2: Generate Relationships (if not converged) ===
-        new_batch = []
         if not relationships_converged:
             if self.config.verbose_logging:
-                logger.debug(f"Generating relationships - Weak patterns to avoid: {len(state['weak_relationships'])}")
+                logger.debug("Generating relationships - Weak patterns to avoid: %d", len(state['weak_relationships']))
             
             weak_patterns_list = self._format_weak_patterns(state["weak_relationships"])
-            new_batch = self._generate_relationships(
-                concepts=concepts,
-                weak_patterns=weak_patterns_list
+            relationship_call = self._generate_relationships(
+                weak_patterns=weak_patterns_list,
+                num_weak=len(state["weak_relationships"])
             )
-            
-            if self.config.verbose_logging:
-                logger.info(f"Generated {len(new_batch)} relationships")
         else:
             if self.config.verbose_logging:
                 logger.info("Relationship generation converged - skipping")
+            relationship_call = skipped()
+        
+        # Neither call depends on the other, so the phase takes as long as the slower one
+        new_merges, new_batch = await asyncio.gather(merge_call, relationship_call)
+        
+        if self.config.verbose_logging:
+            if not merges_converged:
+                logger.info("Found %d merge proposals", len(new_merges))
+            if not relationships_converged:
+                logger.info("Generated %d relationships", len(new_batch))
 
-        updated_state = {
-            **state,
+        # Return only the changed keys; LangGraph applies them onto the state
+        updates = {
             "new_merge_batch": new_merges,
             "new_batch": new_batch
         }
         
-        # Save iteration state after generation
-        self._save_iteration_state(updated_state, iteration, "generation")
+        # Save iteration state after generation (a ChainMap views the updated state without copying it)
+        self._save_iteration_state(ChainMap(updates, state), iteration, "generation")
         
-        return updated_state  # type: ignore
+        return updates
 
     def _format_weak_patterns(self, weak_dict: Dict) -> str:
         """Format weak relationships for prompt."""
@@ -398,24 +660,18 @@ class EnhancedRelationshipService:
         
         return "\n".join(formatted)
     
-    def _find_similar_concepts(
+    async def _find_similar_concepts(
         self,
-        concepts: List[Dict],
         weak_merges: Dict
     ) -> List[ConceptMerge]:
         """Call LLM to find similar concepts that should be merged (name-based only)."""
         
-        # Create concept list (names only, no definitions)
-        concept_list = "\n".join([f"- {c['name']}" for c in concepts])
-        
         # Format weak merges to avoid
         weak_merges_list = self._format_weak_merges(weak_merges)
         num_weak = len(weak_merges)
         
-        # Format prompt
-        messages = CONCEPT_NORMALIZATION_PROMPT.format_messages(
-            num_concepts=len(concepts),
-            concept_list=concept_list,
+        # Format prompt (concept names are bound by `_bind_concepts`)
+        messages = self.concept_merge_prompt.format_messages(
             num_weak=num_weak,
             weak_merges_list=weak_merges_list
         )
@@ -428,25 +684,30 @@ class EnhancedRelationshipService:
         
         try:
             # Use structured output - returns MergeBatch directly
-            batch = self.merge_chain.invoke(messages)  # type: ignore
+            batch = await self._invoke_generation(MergeBatch, messages)
+            self._record_output(MergeBatch, len(batch.merges))  # type: ignore
+            self._prefetch_definitions(
+                {merge.concept_a for merge in batch.merges} | {merge.concept_b for merge in batch.merges}  # type: ignore
+            )
             
             if self.config.verbose_logging:
-                logger.debug(f"Received {len(batch.merges)} merge proposals")  # type: ignore
+                logger.debug("Received %d merge proposals", len(batch.merges))  # type: ignore
             
             return batch.merges  # type: ignore
         
         except Exception as e:
-            logger.error(f"Error in merge generation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in merge generation: %s", e)
             return []
     
-    def _save_iteration_state(self, state: Dict[str, Any], iteration: int, phase: str):
-        """Save iteration state to JSON file for debugging."""
-        if not self.config.verbose_logging:
+    def _save_iteration_state(self, state: Mapping[str, Any], iteration: int, phase: str):
+        """Save iteration state to JSON file for debugging (only when `debug_dump_iterations` is set)."""
+        if not self.config.debug_dump_iterations:
             return
         
         try:
+            merge_feedback = state.get("current_merge_feedback")
+            rel_feedback = state.get("current_feedback")
+            
             # Convert state to serializable format
             serializable_state = {
                 "iteration": iteration,
@@ -464,8 +725,9 @@ class EnhancedRelationshipService:
                     for merge in state.get("all_merges", {}).values()
                 ],
                 "weak_merges": [
-                    {"concept_a": parse_merge_key(key)[0], "concept_b": parse_merge_key(key)[1], "reason": reason}
+                    {"concept_a": concept_a, "concept_b": concept_b, "reason": reason}
                     for key, reason in state.get("weak_merges", {}).items()
+                    for concept_a, concept_b in (parse_merge_key(key),)
                 ],
                 "new_merge_batch": [
                     {
@@ -483,8 +745,9 @@ class EnhancedRelationshipService:
                     for rel in state["all_relationships"].values()
                 ],
                 "weak_patterns": [
-                    {"s": parse_relationship_key(key)[0], "t": parse_relationship_key(key)[1], "rel": parse_relationship_key(key)[2], "reason": reason}
+                    {"s": src, "t": tgt, "rel": rel, "reason": reason}
                     for key, reason in state["weak_relationships"].items()
+                    for src, tgt, rel in (parse_relationship_key(key),)
                 ],
                 "new_batch": [
                     {"s": rel.s, "t": rel.t, "rel": rel.rel, "r": rel.r}
@@ -501,49 +764,73 @@ class EnhancedRelationshipService:
                 },
                 # Feedback
                 "merge_feedback": {
-                    "weak_count": state.get("current_merge_feedback", {}).weak_count if state.get("current_merge_feedback") else 0,
-                    "validation_notes": state.get("current_merge_feedback", {}).validation_notes if state.get("current_merge_feedback") else ""
-                } if state.get("current_merge_feedback") else None,
+                    "weak_count": merge_feedback.weak_count,
+                    "validation_notes": merge_feedback.validation_notes
+                } if merge_feedback else None,
                 "relationship_feedback": {
-                    "weak_count": state.get("current_feedback", {}).weak_count if state.get("current_feedback") else 0,
-                    "validation_notes": state.get("current_feedback", {}).validation_notes if state.get("current_feedback") else ""
-                } if state.get("current_feedback") else None
+                    "weak_count": rel_feedback.weak_count,
+                    "validation_notes": rel_feedback.validation_notes
+                } if rel_feedback else None
             }
             
-            filename = f"{self.debug_dir}/iteration_{iteration:02d}_{phase}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(serializable_state, f, indent=2, ensure_ascii=False)
-            
-            if self.config.verbose_logging:
-                logger.debug(f"Saved state to {filename}")
+        except Exception as e:
+            logger.warning("Failed to save iteration state: %s", e)
+            return
+        
+        # The snapshot is already detached from the live state, so only the
+        # serialization and disk write move to the writer thread
+        filename = f"{self.debug_dir}/iteration_{iteration:02d}_{phase}.json"
+        if self._io_pool is not None:
+            self._io_pool.submit(self._write_iteration_state, filename, serializable_state)
+        else:
+            self._write_iteration_state(filename, serializable_state)
+    
+    @staticmethod
+    def _write_iteration_state(filename: str, serializable_state: Dict[str, Any]) -> None:
+        """Serialize one iteration snapshot to disk (compact; pipe through `jq` to read)."""
+        try:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(serializable_state))
+            logger.debug("Saved state to %s", filename)
         
         except Exception as e:
-            logger.warning(f"Failed to save iteration state: {e}")
+            logger.warning("Failed to save iteration state: %s", e)
     
-    def _generate_relationships(
+    async def _generate_relationships(
         self,
-        concepts: List[Dict],
-        weak_patterns: str
+        weak_patterns: str,
+        num_weak: int
     ) -> List[ConceptRelationship]:
-        """Call LLM to generate relationships."""
+        """Call LLM to generate relationships, one concurrent call per concept shard."""
         
-        # Create concept list
-        concept_list = "\n".join([f"- {c['name']}" for c in concepts])
+        shard_batches = await asyncio.gather(*(
+            self._generate_shard_relationships(prompt, weak_patterns, num_weak)
+            for prompt in self.concept_generation_prompts
+        ))
+        if len(shard_batches) == 1:
+            return shard_batches[0]
         
-        # Create relationship types description
-        relationship_types_desc = "\n".join([
-            f"- **{rel_type}**: {desc}"
-            for rel_type, desc in self.relationship_types.items()
-        ])
+        # Overlapping shards can propose the same relationship
+        unique_relationships = {}
+        for batch in shard_batches:
+            for rel in batch:
+                unique_relationships.setdefault(make_relationship_key(rel.s, rel.t, rel.rel), rel)
         
-        # Count weak patterns
-        num_weak = len(weak_patterns.split('\n')) if weak_patterns != "(none yet)" else 0
+        if self.config.verbose_logging:
+            logger.debug("Merged %d generation shards into %d relationships", len(shard_batches), len(unique_relationships))
         
-        # Format prompt
-        messages = BINARY_GENERATION_PROMPT.format_messages(
-            num_concepts=len(concepts),
-            concept_list=concept_list,
-            relationship_types_desc=relationship_types_desc,
+        return list(unique_relationships.values())
+    
+    async def _generate_shard_relationships(
+        self,
+        prompt: PrerenderedPrompt,
+        weak_patterns: str,
+        num_weak: int
+    ) -> List[ConceptRelationship]:
+        """Call LLM to generate relationships among the concepts rendered into `prompt`."""
+        
+        # Format prompt (concept names are bound by `_bind_concepts`)
+        messages = prompt.format_messages(
             num_weak=num_weak,
             weak_patterns_list=weak_patterns
         )
@@ -556,24 +843,30 @@ class EnhancedRelationshipService:
         
         try:
             # Use structured output - returns RelationshipBatch directly
-            batch = self.relationship_chain.invoke(messages)  # type: ignore
+            batch = await self._invoke_generation(RelationshipBatch, messages)
+            self._record_output(RelationshipBatch, len(batch.relationships))  # type: ignore
             
             if self.config.verbose_logging:
-                logger.debug(f"Received {len(batch.relationships)} relationships")  # type: ignore
+                logger.debug("Received %d relationships", len(batch.relationships))  # type: ignore
+            
+            for rel in batch.relationships:  # type: ignore
+                rel.rel = self._decode_relation(rel.rel)
+            self._prefetch_definitions(
+                {rel.s for rel in batch.relationships} | {rel.t for rel in batch.relationships}  # type: ignore
+            )
             
             return batch.relationships  # type: ignore
         
         except Exception as e:
-            logger.error(f"Error in generation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in generation: %s", e)
             return []
     
-    def _validation_node(self, state: EnhancedRelationshipState) -> EnhancedRelationshipState:
+    async def _validation_node(self, state: EnhancedRelationshipState) -> Dict[str, Any]:
         """
         Validation node: Validate merges AND relationships, accumulate valid ones programmatically.
         
         Binary classification - returns only weak items, valid ones calculated programmatically.
+        The two validations are independent LLM calls and run concurrently.
         """
         new_merge_batch = state["new_merge_batch"]
         new_relationship_batch = state["new_batch"]
@@ -585,119 +878,119 @@ class EnhancedRelationshipService:
 
         if not new_merge_batch and not new_relationship_batch:
             logger.warning("Nothing to validate")
-            return {**state, "iteration_count": state["iteration_count"] + 1}  # type: ignore
+            return {"iteration_count": state["iteration_count"] + 1}
 
         if self.config.verbose_logging:
             logger.info("Validation Phase")
         
+        async def skipped() -> None:
+            return None
+        
+        # Key each proposal once; repeats within the batch and items already accepted
+        # (or, for merges, already rejected) are not sent to the validator again
+        # (string keys are order-normalized by make_merge_key)
+        candidate_merges = {}
+        for merge in new_merge_batch:
+            key = make_merge_key(merge.concept_a, merge.concept_b)
+            if key not in all_merges and key not in weak_merges:
+                candidate_merges.setdefault(key, merge)
+        candidate_rels = {}
+        for rel in new_relationship_batch:
+            key = make_relationship_key(rel.s, rel.t, rel.rel)
+            if key not in all_relationships:
+                candidate_rels.setdefault(key, rel)
+        
+        if new_merge_batch and self.config.verbose_logging:
+            logger.debug("Validating %d of %d merge proposals", len(candidate_merges), len(new_merge_batch))
+        if new_relationship_batch and self.config.verbose_logging:
+            logger.debug("Validating %d of %d relationships", len(candidate_rels), len(new_relationship_batch))
+        
+        merge_feedback, rel_feedback = await asyncio.gather(
+            self._validate_merges(list(candidate_merges.values())) if candidate_merges else skipped(),
+            self._validate_relationships(list(candidate_rels.values())) if candidate_rels else skipped()
+        )
+        
         # === VALIDATE MERGES ===
-        merge_feedback = None
         valid_merge_count = 0
         if new_merge_batch:
-            if self.config.verbose_logging:
-                logger.debug(f"Validating {len(new_merge_batch)} merge proposals")
-            
-            merge_feedback = self._validate_merges(new_merge_batch)
-            
             # Process merge validation - accumulate weak merges first
-            for weak_merge in merge_feedback.weak_merges:
-                # Use string key (automatically sorts for normalization)
-                key = make_merge_key(weak_merge.concept_a, weak_merge.concept_b)
-                weak_merges[key] = weak_merge.w
+            if merge_feedback:
+                weak_merges.update({
+                    make_merge_key(weak_merge.concept_a, weak_merge.concept_b): weak_merge.w
+                    for weak_merge in merge_feedback.weak_merges
+                })
             
-            # Calculate valid merges - filter against ALL accumulated weak merges (not just current iteration)
-            valid_merges = []
-            for m in new_merge_batch:
-                # Use string key to match weak_merges format
-                key = make_merge_key(m.concept_a, m.concept_b)
-                # Check against accumulated weak_merges dict (includes all iterations)
-                if key not in weak_merges:
-                    valid_merges.append(m)
+            # Valid merges: candidates not flagged weak (the dict keeps proposal order)
+            valid_merges = {
+                key: merge for key, merge in candidate_merges.items()
+                if key not in weak_merges
+            }
             
-            # Add to accumulated merges (auto-deduplicate)
-            new_unique_merges = 0
-            for merge in valid_merges:
-                # Use string key (automatically sorts for normalization)
-                key = make_merge_key(merge.concept_a, merge.concept_b)
-                if key not in all_merges:
-                    new_unique_merges += 1
-                all_merges[key] = merge
+            # Candidates exclude accumulated merges, so every valid one is new
+            new_unique_merges = len(valid_merges)
+            all_merges.update(valid_merges)
             
             valid_merge_count = len(valid_merges)
             
             if self.config.verbose_logging:
-                logger.info(f"Merge validation - Total: {merge_feedback.total_validated}, Weak: {merge_feedback.weak_count}, Valid: {valid_merge_count}, New unique: {new_unique_merges}, Accumulated: {len(all_merges)}")
+                logger.info(
+                    "Merge validation - Total: %d, Weak: %d, Valid: %d, New unique: %d, Accumulated: %d",
+                    len(candidate_merges), merge_feedback.weak_count if merge_feedback else 0,
+                    valid_merge_count, new_unique_merges, len(all_merges)
+                )
 
         # === VALIDATE RELATIONSHIPS ===
-        rel_feedback = None
         valid_rel_count = 0
         if new_relationship_batch:
-            if self.config.verbose_logging:
-                logger.debug(f"Validating {len(new_relationship_batch)} relationships")
-
-            # Get concept definitions from Neo4j
-            concept_names = set()
-            for rel in new_relationship_batch:
-                concept_names.update([rel.s, rel.t])
-
-            definitions = self.neo4j_service.get_concept_definitions(list(concept_names))
-
-            # Validate relationships
-            rel_feedback = self._validate_relationships(new_relationship_batch, definitions)
-
-            if self.config.verbose_logging:
-                logger.debug(f"Relationship validation - Total: {rel_feedback.total_validated}, Weak: {rel_feedback.weak_count}, Valid: {rel_feedback.total_validated - rel_feedback.weak_count}")
+            if self.config.verbose_logging and rel_feedback:
+                logger.debug(
+                    "Relationship validation - Total: %d, Weak: %d, Valid: %d",
+                    rel_feedback.total_validated, rel_feedback.weak_count,
+                    rel_feedback.total_validated - rel_feedback.weak_count
+                )
 
             # === PROGRAMMATIC PROCESSING ===
             
             # 1. Extract weak keys and update weak_relationships dict
-            weak_keys = set()
-            for weak_rel in rel_feedback.weak_relationships:
-                key = make_relationship_key(weak_rel.s, weak_rel.t, weak_rel.rel)
-                weak_keys.add(key)
-                
-                # Add/update weak_relationships dict
-                weak_relationships[key] = weak_rel.w
+            weak_updates = {
+                make_relationship_key(weak_rel.s, weak_rel.t, weak_rel.rel): weak_rel.w
+                for weak_rel in rel_feedback.weak_relationships
+            } if rel_feedback else {}
+            weak_relationships.update(weak_updates)
 
-            # 2. Calculate valid relationships (new_batch - weak)
-            valid_rels = [
-                rel for rel in new_relationship_batch
-                if make_relationship_key(rel.s, rel.t, rel.rel) not in weak_keys
-            ]
+            # 2. Calculate valid relationships (candidates - weak)
+            valid_rels = {
+                key: rel for key, rel in candidate_rels.items()
+                if key not in weak_updates
+            }
 
-            # 3. Add valid relationships to all_relationships (auto-deduplicate)
-            new_unique_count = 0
-            for rel in valid_rels:
-                key = make_relationship_key(rel.s, rel.t, rel.rel)
-                if key not in all_relationships:
-                    new_unique_count += 1
-                all_relationships[key] = rel
+            # 3. Add valid relationships to all_relationships (candidates exclude
+            # accumulated ones, so every valid one is new)
+            new_unique_count = len(valid_rels)
+            all_relationships.update(valid_rels)
 
             valid_rel_count = len(valid_rels)
 
             if self.config.verbose_logging:
-                logger.info(f"New unique valid relationships: {new_unique_count}, Total accumulated: {len(all_relationships)}")
+                logger.info("New unique valid relationships: %d, Total accumulated: %d", new_unique_count, len(all_relationships))
 
-        # Update convergence metrics
+        # Update convergence metrics; a track converges once a batch it produced
+        # adds no new unique items (the batch itself is this iteration's data)
         metrics = state["convergence_metrics"]
         
-        # Track new unique counts for convergence checking
-        new_unique_rels = 0
-        new_unique_merges_count = 0
-        
         # Update relationship trends
         if new_relationship_batch:
-            new_unique_rels = new_unique_count
             metrics.update_trends(
                 valid_count=valid_rel_count,
                 weak_count=rel_feedback.weak_count if rel_feedback else 0,
                 total_accumulated=len(all_relationships),
                 new_unique_relationships=new_unique_count
             )
+            if new_unique_count == 0:
+                metrics.relationships_converged = True
         
         # Update merge trends
         if new_merge_batch:
-            new_unique_merges_count = new_unique_merges
             metrics.update_merge_trends(
                 merge_count=len(new_merge_batch),
                 valid_merge_count=valid_merge_count,
@@ -705,13 +998,8 @@ class EnhancedRelationshipService:
                 total_merges=len(all_merges),
                 new_unique_merges=new_unique_merges
             )
-        
-        # Update convergence flags based on new unique counts
-        # Only mark as converged if we have at least one iteration of data
-        if new_relationship_batch and new_unique_rels == 0 and len(metrics.new_unique_relationships_trend) > 0:
-            metrics.relationships_converged = True
-        if new_merge_batch and new_unique_merges_count == 0 and len(metrics.new_unique_merges_trend) > 0:
-            metrics.merges_converged = True
+            if new_unique_merges == 0:
+                metrics.merges_converged = True
 
         # Create iteration snapshot
         snapshot = IterationSnapshot(
@@ -725,8 +1013,8 @@ class EnhancedRelationshipService:
         # Update iteration history
         new_history = state["iteration_history"] + [snapshot] if self.config.enable_history_tracking else []
 
-        updated_state = {
-            **state,
+        # Return only the changed keys (the accumulators were updated in place)
+        updates = {
             "all_merges": all_merges,
             "weak_merges": weak_merges,
             "new_merge_batch": [],  # Clear for next iteration
@@ -741,35 +1029,93 @@ class EnhancedRelationshipService:
         }
         
         # Save iteration state after validation
-        self._save_iteration_state(updated_state, state["iteration_count"], "validation")
+        self._save_iteration_state(ChainMap(updates, state), state["iteration_count"], "validation")
         
-        return updated_state  # type: ignore
+        return updates
+    
+    def _decode_relation(self, rel: str) -> str:
+        """Map a single-letter relation code to its full type name (full names pass through)."""
+        return self.relationship_type_codes.get(rel.strip().upper(), rel)
     
-    def _validate_relationships(
+    def _fetch_definitions(self, concept_names) -> asyncio.Task:
+        """Start looking up definitions for the given concepts in the background."""
+        return asyncio.ensure_future(self._get_definitions(list(concept_names)))
+    
+    def _prefetch_definitions(self, concept_names) -> None:
+        """
+        Start a Neo4j lookup for names not seen this run, without waiting for it.
+        
+        Generation calls this as soon as a batch lands, so the lookup overlaps the
+        remaining generation calls; validation then awaits the in-flight lookup
+        instead of querying again.
+        """
+        missing = [name for name in concept_names if name not in self._definition_cache]
+        if missing:
+            # The Neo4j driver blocks, so the query runs on the shared pool
+            lookup = asyncio.get_running_loop().run_in_executor(
+                self._neo4j_pool, self.neo4j_service.get_concept_definitions, missing
+            )
+            for name in missing:
+                self._definition_cache[name] = lookup
+    
+    async def _get_definitions(self, concept_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Definitions for the given concepts, querying Neo4j only for names not seen this run.
+        
+        Definitions do not change during a run and consecutive batches share most of
+        their concepts; names without definitions are cached too, so they are not re-queried.
+        While a lookup is in flight its names map to the pending future.
+        """
+        self._prefetch_definitions(concept_names)
+        lookups = {
+            self._definition_cache[name] for name in concept_names
+            if isinstance(self._definition_cache[name], asyncio.Future)
+        }
+        for lookup in lookups:
+            try:
+                fetched = await lookup
+            except Exception:
+                # Forget the failed lookup so a later batch retries its names
+                self._definition_cache = {
+                    name: value for name, value in self._definition_cache.items() if value is not lookup
+                }
+                raise
+            for name in concept_names:
+                if self._definition_cache[name] is lookup:
+                    self._definition_cache[name] = fetched.get(name, [])
+        
+        return {
+            name: self._definition_cache[name]
+            for name in concept_names
+            if self._definition_cache[name]
+        }
+    
+    async def _validate_relationships(
         self,
-        batch: List[ConceptRelationship],
-        definitions: Dict[str, List[str]]
+        batch: List[ConceptRelationship]
     ) -> ValidationFeedback:
-        """Call LLM to validate relationships."""
+        """Call LLM to validate relationships against their concepts' definitions."""
+        
+        # Get definitions for all concepts in batch; the lookup runs while the summary is built
+        concept_names = set()
+        for rel in batch:
+            concept_names.update([rel.s, rel.t])
+        definitions_future = self._fetch_definitions(concept_names)
         
         # Format relationships
-        relationships_summary = "\n".join([
-            f"{i+1}. {rel.s} --[{rel.rel}]--> {rel.t}\n   Reasoning: {rel.r}"
-            for i, rel in enumerate(batch)
-        ])
+        relationships_summary = "\n".join(
+            f"{i}. {rel.s} --[{rel.rel}]--> {rel.t}\n   Reasoning: {rel.r}"
+            for i, rel in enumerate(batch, 1)
+        )
         
         # Format definitions
-        definitions_text = self._format_definitions(definitions)
-        
-        # Create relationship types string
-        relationship_types = ", ".join(self.relationship_type_names)
+        definitions_text = self._format_definitions(await definitions_future)
         
         # Format prompt
-        messages = BINARY_VALIDATION_PROMPT.format_messages(
+        messages = self.validation_prompt.format_messages(
             num_relationships=len(batch),
             relationships_summary=relationships_summary,
-            definitions_text=definitions_text,
-            relationship_types=relationship_types
+            definitions_text=definitions_text
         )
         
         # Log prompt length
@@ -777,17 +1123,19 @@ class EnhancedRelationshipService:
         
         try:
             # Use structured output - returns ValidationFeedback directly
-            feedback = self.validation_chain.invoke(messages)  # type: ignore
+            feedback = await self.validation_chain.ainvoke(messages)  # type: ignore
+            
+            # Validator may echo either codes or full names while both forms are in circulation
+            for weak_rel in feedback.weak_relationships:  # type: ignore
+                weak_rel.rel = self._decode_relation(weak_rel.rel)
             
             if self.config.verbose_logging:
-                logger.debug(f"Validation complete: {feedback.weak_count} weak relationships found")  # type: ignore
+                logger.debug("Validation complete: %d weak relationships found", feedback.weak_count)  # type: ignore
             
             return feedback  # type: ignore
         
         except Exception as e:
-            logger.error(f"Error in validation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in validation: %s", e)
             
             # Return default feedback (all valid)
             return ValidationFeedback(
@@ -797,27 +1145,27 @@ class EnhancedRelationshipService:
                 weak_count=0
             )
     
-    def _validate_merges(
+    async def _validate_merges(
         self,
         batch: List[ConceptMerge]
     ) -> MergeValidationFeedback:
         """Call LLM to validate merge proposals using definitions."""
         
-        # Get definitions for all concepts in batch
+        # Get definitions for all concepts in batch; the lookup runs while the summary is built
         concept_names = set()
         for merge in batch:
             concept_names.update([merge.concept_a, merge.concept_b])
+        definitions_future = self._fetch_definitions(concept_names)
         
-        definitions = self.neo4j_service.get_concept_definitions(list(concept_names))
+        # Format merges summary
+        merges_summary = "\n".join(
+            f"{i}. {merge.concept_a} + {merge.concept_b} → {merge.canonical}\n   Reasoning: {merge.r}"
+            for i, merge in enumerate(batch, 1)
+        )
         
+        definitions = await definitions_future
         if self.config.verbose_logging:
-            logger.debug(f"Retrieved definitions for {len(concept_names)} concepts")
-        
-        # Format merges summary
-        merges_summary = "\n".join([
-            f"{i+1}. {merge.concept_a} + {merge.concept_b} → {merge.canonical}\n   Reasoning: {merge.r}"
-            for i, merge in enumerate(batch)
-        ])
+            logger.debug("Retrieved definitions for %d concepts", len(concept_names))
         
         # Format definitions
         definitions_text = self._format_definitions(definitions)
@@ -834,17 +1182,15 @@ class EnhancedRelationshipService:
         
         try:
             # Use structured output - returns MergeValidationFeedback directly
-            feedback = self.merge_validation_chain.invoke(messages)  # type: ignore
+            feedback = await self.merge_validation_chain.ainvoke(messages)  # type: ignore
             
             if self.config.verbose_logging:
-                logger.debug(f"Merge validation complete: {feedback.weak_count} weak merges found")  # type: ignore
+                logger.debug("Merge validation complete: %d weak merges found", feedback.weak_count)  # type: ignore
             
             return feedback  # type: ignore
         
         except Exception as e:
-            logger.error(f"Error in merge validation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in merge validation: %s", e)
             
             # Return default feedback (all valid)
             return MergeValidationFeedback(
@@ -859,7 +1205,7 @@ class EnhancedRelationshipService:
         Convergence checker: Determine if workflow should continue or complete.
         
         Convergence criteria:
-        - Both merges AND relationships produce 0 new unique items
+        - Both merges AND relationships produce 0 new unique items (or are both marked converged)
         - Maximum iterations reached
         """
         iteration = state["iteration_count"]
@@ -874,8 +1220,11 @@ class EnhancedRelationshipService:
         is_converged = False
         reason = ""
         
-        # Convergence: Both tasks produced 0 new items
-        if latest_merges == 0 and latest_rels == 0:
+        # Convergence: Both tasks produced 0 new items, or both tracks are already
+        # flagged converged (another round would enter generation only to skip both calls)
+        if (latest_merges == 0 and latest_rels == 0) or (
+            metrics.merges_converged and metrics.relationships_converged
+        ):
             is_converged = True
             reason = "Both tasks exhausted - no new discoveries"
         elif iteration >= max_iterations:
@@ -892,23 +1241,29 @@ class EnhancedRelationshipService:
 
         if self.config.verbose_logging:
             if is_converged:
-                logger.info(f"CONVERGENCE ACHIEVED - Reason: {reason}, Total merges: {len(state['all_merges'])}, Total relationships: {len(state['all_relationships'])}")
+                logger.info(
+                    "CONVERGENCE ACHIEVED - Reason: %s, Total merges: %d, Total relationships: %d",
+                    reason, len(state['all_merges']), len(state['all_relationships'])
+                )
             else:
-                logger.info(f"Continuing iteration - Reason: {reason}")
+                logger.info("Continuing iteration - Reason: %s", reason)
 
         return "complete" if is_converged else "continue"
     
     def _format_definitions(self, definitions: Dict[str, List[str]]) -> str:
         """Format concept definitions for prompt."""
-        if not definitions:
-            return "(no definitions available)"
-        
+        # Definitions are fixed for the run, so each concept's block is rendered once
+        # and reused by every later batch that includes the concept
         formatted = []
         for concept, defs in definitions.items():
             if defs:
-                formatted.append(f"\n**{concept}**:")
-                for i, definition in enumerate(defs, 1):
-                    formatted.append(f"  {i}. {definition}")
+                block = self._definition_blocks.get(concept)
+                if block is None:
+                    block = self._definition_blocks[concept] = "\n".join([
+                        f"\n**{concept}**:",
+                        *(f"  {i}. {definition}" for i, definition in enumerate(defs, 1))
+                    ])
+                formatted.append(block)
         
         return "\n".join(formatted) if formatted else "(no definitions available)"
     
@@ -981,10 +1336,11 @@ class EnhancedRelationshipService:
         ]
         
         # Show what relationships WOULD look like with canonical names
+        canonical_names = self._canonical_names(final_state["all_merges"])
         canonical_preview = []
         for rel in relationships:
-            canonical_s = self._map_to_canonical(rel.s, final_state["all_merges"])
-            canonical_t = self._map_to_canonical(rel.t, final_state["all_merges"])
+            canonical_s = canonical_names.get(rel.s, rel.s)
+            canonical_t = canonical_names.get(rel.t, rel.t)
             
             canonical_preview.append({
                 "original": {"s": rel.s, "t": rel.t},
@@ -1029,9 +1385,9 @@ class EnhancedRelationshipService:
                 for snapshot in final_state["iteration_history"]
             ]
 
-        # Save to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Save to file (the returned path must be complete, so this write stays synchronous)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
         print(f"\n{'='*80}")
         print(f"📁 Results saved to: {output_path}")
@@ -1040,16 +1396,20 @@ class EnhancedRelationshipService:
 
         return output_path
     
-    def _map_to_canonical(
-        self,
-        concept_name: str,
-        merge_state: Dict
-    ) -> str:
-        """Map original concept name to canonical name if merged."""
+    @staticmethod
+    def _canonical_names(merge_state: Dict) -> Dict[str, str]:
+        """
+        Map each merged variant name to its canonical name.
+        
+        Built once per results file so each relationship endpoint is a dict lookup
+        instead of a scan over every merge; when a name is a variant of several
+        merges, the first merge wins (as the scan did). Unmerged names are absent.
+        """
+        canonical_names: Dict[str, str] = {}
         for merge_info in merge_state.values():
-            if concept_name in merge_info.variants:
-                return merge_info.canonical
-        return concept_name  # Not merged
+            for variant in merge_info.variants:
+                canonical_names.setdefault(variant, merge_info.canonical)
+        return canonical_names
 
     def _print_summary(self, workflow_stats: Dict, output_path: str):
         """Print workflow summary including merges and relationships."""
@@ -22,13 +22,16 @@ from pydantic import ValidationError
 from models.extraction_models import (
     CanonicalExtractionResult,
     CanonicalExtractionWithText,
+    CompactCanonicalExtractionResult,
     CompleteExtractionResult,
     ExtractionMetadata,
     ConceptExtraction
 )
 from prompts.extraction_prompts import (
     COMPLETE_EXTRACTION_PROMPT,
-    EXTRACTION_PROMPT_WITH_EXAMPLES
+    EXTRACTION_PROMPT_WITH_EXAMPLES,
+    LEGACY_COMPLETE_EXTRACTION_PROMPT,
+    LEGACY_EXTRACTION_PROMPT_WITH_EXAMPLES
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +51,8 @@ class LangChainCanonicalExtractionService:
         verbose: bool = True,
         enhanced_debug: bool = False,
         use_examples: bool = True,
+        compact_output: bool = True,
+        semantic_cache=None,
     ) -> None:
         """
         Initialize the LangChain extraction service.
@@ -57,6 +62,11 @@ class LangChainCanonicalExtractionService:
             verbose: Enable verbose logging for debugging
             enhanced_debug: Enable enhanced debugging with detailed step-by-step output
             use_examples: Use few-shot examples in prompts for better performance
+            compact_output: Ask the LLM for positional `[name, definition, text_evidence]`
+                concept arrays (fewer output tokens); False keeps the legacy keyed objects
+            semantic_cache: Optional SemanticExtractionCache; identical texts and edited
+                versions of an already extracted file reuse its cached extraction
+                instead of calling the LLM
         """
         load_dotenv()
 
@@ -79,6 +89,8 @@ class LangChainCanonicalExtractionService:
         self.verbose = verbose
         self.enhanced_debug = enhanced_debug or verbose  # Enhanced debug if explicitly enabled or verbose is True
         self.use_examples = use_examples
+        self.compact_output = compact_output
+        self.semantic_cache = semantic_cache
 
         # Instance variables for saving lambda
         self.current_output_path = None
@@ -103,12 +115,17 @@ class LangChainCanonicalExtractionService:
         # For GPT-4o via proxy, json_mode tends to be more reliable.
         # For DeepSeek and others, function_calling usually works better.
         method = "json_mode" if "gpt-4o" in model_id else "function_calling"
-        self.extraction_chain = base_llm.with_structured_output(CanonicalExtractionResult, method=method)
+        if self.compact_output:
+            # Expand positional concept arrays back into keyed ConceptExtraction objects
+            self.extraction_chain = base_llm.with_structured_output(
+                CompactCanonicalExtractionResult, method=method
+            ) | RunnableLambda(CompactCanonicalExtractionResult.to_canonical)
+        else:
+            self.extraction_chain = base_llm.with_structured_output(CanonicalExtractionResult, method=method)
         self.llm = base_llm
 
         # Create simple prompt template using separated prompt content
-        prompt_content = EXTRACTION_PROMPT_WITH_EXAMPLES if self.use_examples else COMPLETE_EXTRACTION_PROMPT
-        self.prompt_template = PromptTemplate.from_template(prompt_content)
+        self.prompt_template = self._build_prompt_template()
 
         # Create saving lambda for automatic JSON saving
         self.saving_lambda = RunnableLambda(self._save_extraction_result)
@@ -132,8 +149,7 @@ class LangChainCanonicalExtractionService:
         if use_examples is not None:
             self.use_examples = use_examples
             # Recreate prompt template with new setting
-            prompt_content = EXTRACTION_PROMPT_WITH_EXAMPLES if self.use_examples else COMPLETE_EXTRACTION_PROMPT
-            self.prompt_template = PromptTemplate.from_template(prompt_content)
+            self.prompt_template = self._build_prompt_template()
             # Recreate the chain with updated prompt
             self.chain = self.prompt_template | self.extraction_chain | self.saving_lambda
 
@@ -147,6 +163,13 @@ class LangChainCanonicalExtractionService:
         else:
             logger.info("Debug mode DISABLED")
 
+    def _build_prompt_template(self) -> PromptTemplate:
+        """Select the extraction prompt matching the examples and output-format settings."""
+        if self.compact_output:
+            prompt_content = EXTRACTION_PROMPT_WITH_EXAMPLES if self.use_examples else COMPLETE_EXTRACTION_PROMPT
+        else:
+            prompt_content = LEGACY_EXTRACTION_PROMPT_WITH_EXAMPLES if self.use_examples else LEGACY_COMPLETE_EXTRACTION_PROMPT
+        return PromptTemplate.from_template(prompt_content)
 
 
     def preprocess_text(self, text: str) -> str:
@@ -244,6 +267,27 @@ class LangChainCanonicalExtractionService:
 
 
 
+    def _lookup_semantic_cache(self, text: str, source_file_path: Optional[str]) -> Optional[CanonicalExtractionResult]:
+        """Cached extraction of this document, or None (cache errors count as misses)."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            cached = self.semantic_cache.get(text, source=source_file_path)
+            return CanonicalExtractionResult.model_validate(cached) if cached is not None else None
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    def _store_semantic_cache(self, text: str, source_file_path: Optional[str],
+                              extraction_result: CanonicalExtractionResult) -> None:
+        """Remember an LLM extraction for later runs over the same document."""
+        if self.semantic_cache is None:
+            return
+        try:
+            self.semantic_cache.put(text, extraction_result.model_dump(), source=source_file_path)
+        except Exception as e:
+            logger.warning(f"Semantic cache update failed: {e}")
+
     def compress_and_extract_concepts(self, documents: List[Document], source_file_path: Optional[str] = None) -> CompleteExtractionResult:
         """
         Extract canonical concepts using LangChain structured output.
@@ -366,7 +410,13 @@ class LangChainCanonicalExtractionService:
                 print(f"📥 Contains C++ content: {'C++' in chain_input['text']}")
                 print("=" * 60)
 
-            extraction_result = self.chain.invoke({"text": cleaned_text}, config=config)
+            cached_extraction = self._lookup_semantic_cache(cleaned_text, source_file_path)
+            if cached_extraction is not None:
+                # Same text, or an earlier version of this file: skip the LLM, still save the JSON
+                extraction_result = self._save_extraction_result(cached_extraction)
+            else:
+                extraction_result = self.chain.invoke({"text": cleaned_text}, config=config)
+                self._store_semantic_cache(cleaned_text, source_file_path, extraction_result)
 
             # Enhanced verbose debugging - show extraction results with content verification
             if self.enhanced_debug:
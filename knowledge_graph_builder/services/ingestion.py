@@ -1,16 +1,47 @@
+import os
+import json
 import time
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
-from utils.doc_utils import load_single_docx_document
+from tqdm import tqdm
+
+from utils.doc_utils import list_docx_files, load_json_file, load_single_docx_document
 from utils.output_utils import organize_extraction_output
 from services.extraction_langchain import LangChainCanonicalExtractionService
-from services.embedding import EmbeddingService
+from services.embedding_cache import get_cached_embedder
+from services.semantic_cache import SemanticExtractionCache
 from models.neo4j_models import Neo4jInsertionResult
 
 logger = logging.getLogger(__name__)
 
+# Documents already extracted into an output directory, keyed by "path:mtime_ns"
+PROCESSED_MANIFEST_NAME = ".processed.json"
+
+# Finished extractions embedded, inserted and recorded together in process_batch_documents
+MANIFEST_FLUSH_EVERY = 10
+
+# Per-process IngestionService for parallel extraction workers (see _init_extraction_worker)
+_worker_ingestion: Optional["IngestionService"] = None
+
+
+def _init_extraction_worker(use_semantic_cache: bool = False) -> None:
+    """ProcessPoolExecutor initializer: build this worker's own LLM clients once."""
+    global _worker_ingestion
+    _worker_ingestion = IngestionService(use_semantic_cache=use_semantic_cache)
+
+
+def _extract_in_worker(docx_path: str, output_dir: str) -> Dict[str, Any]:
+    """Extract one document in a worker process; Neo4j insertion stays in the parent."""
+    return _worker_ingestion.process_single_document(
+        docx_path=docx_path,
+        output_dir=output_dir,
+        insert_to_neo4j=False
+    )
+
 
 class IngestionService:
     """
@@ -21,7 +52,8 @@ class IngestionService:
     _canonical_extraction_service: LangChainCanonicalExtractionService
     _neo4j_service: Any
 
-    def __init__(self, neo4j_service=None, embedding_service=None, canonical_extraction_service=None):
+    def __init__(self, neo4j_service=None, embedding_service=None, canonical_extraction_service=None,
+                 use_semantic_cache: bool = False):
         """
         Initialize with optional services. Services will be auto-initialized if not provided.
 
@@ -29,12 +61,17 @@ class IngestionService:
             neo4j_service: Optional Neo4j service instance
             embedding_service: Optional embedding service instance
             canonical_extraction_service: Optional LangChain canonical extraction service
+            use_semantic_cache: Reuse extractions of identical or re-edited documents (only applies
+                to the default extraction service)
         """
         # Neo4j is optional for extraction-only workflows. Only initialize when needed.
         self._neo4j_service = neo4j_service
         # Embeddings are optional for extraction-only workflows. Only initialize when needed.
         self._embedding_service = embedding_service
-        self._canonical_extraction_service = canonical_extraction_service or LangChainCanonicalExtractionService()
+        self.use_semantic_cache = use_semantic_cache
+        # The LLM client is only needed once extraction starts (dry runs and parents of
+        # parallel extraction workers never use it). Only initialize when needed.
+        self._canonical_extraction_service = canonical_extraction_service
 
     @property
     def neo4j_service(self):
@@ -42,21 +79,43 @@ class IngestionService:
         if self._neo4j_service is None:
             from neo4j_database import Neo4jService  # local import to keep Neo4j optional
 
-            self._neo4j_service = Neo4jService()
+            self._neo4j_service = Neo4jService(embedding_service=self.embedding_service)
         return self._neo4j_service
 
     @property
     def embedding_service(self):
         """Get the embedding service instance."""
         if self._embedding_service is None:
-            self._embedding_service = EmbeddingService()
+            self._embedding_service = get_cached_embedder()
         return self._embedding_service
 
     @property
     def canonical_extraction_service(self):
         """Get the canonical extraction service instance."""
+        if self._canonical_extraction_service is None:
+            semantic_cache = (
+                SemanticExtractionCache(embedding_service=self._embedding_service)
+                if self.use_semantic_cache else None
+            )
+            self._canonical_extraction_service = LangChainCanonicalExtractionService(
+                semantic_cache=semantic_cache
+            )
         return self._canonical_extraction_service
 
+    def warmup(self, max_workers: int = 1, insert_to_neo4j: bool = True) -> None:
+        """
+        Build the clients a processing run will use, so configuration errors surface
+        before the first file rather than partway through a batch.
+
+        Args:
+            max_workers: Extraction processes for the run (workers build their own LLM client)
+            insert_to_neo4j: Whether the run inserts into Neo4j
+        """
+        if max_workers <= 1:
+            _ = self.canonical_extraction_service
+        if insert_to_neo4j:
+            _ = self.neo4j_service
+
 
 
     def process_single_document(self, docx_path: str, output_dir: str = "output",
@@ -95,8 +154,9 @@ class IngestionService:
             # Perform LangChain canonical extraction first to get the topic
             base_filename = Path(docx_path).stem
 
-            # Set up temporary output path for initial extraction
-            temp_output_path = Path(output_dir) / "temp_extraction"
+            # Set up temporary output path for initial extraction (per process, so
+            # parallel extraction workers never remove each other's temp dir)
+            temp_output_path = Path(output_dir) / f"temp_extraction_{os.getpid()}"
             self.canonical_extraction_service.current_output_path = str(temp_output_path)
             self.canonical_extraction_service.current_filename = base_filename
 
@@ -167,8 +227,139 @@ class IngestionService:
                 'error': str(e)
             }
 
+    def process_documents_batch(self, docx_files: List[Path], output_dir: str,
+                                batch_size: int = 100, max_workers: int = 1,
+                                progress: Optional[tqdm] = None) -> List[Dict[str, Any]]:
+        """
+        Extract several DOCX files, then embed and insert them into Neo4j together.
+
+        Extraction runs per file as in `process_single_document`, in a pool of
+        `max_workers` processes when more than one is requested. The extracted
+        files are then embedded and inserted as in `_embed_and_insert`.
+
+        Args:
+            docx_files: DOCX files to process
+            output_dir: Base directory to create structured folders
+            batch_size: Maximum number of summaries per embedding request
+            max_workers: Number of extraction processes (1 extracts in this process)
+            progress: Progress bar advanced once per extracted file (a new one when omitted)
+
+        Returns:
+            One `process_single_document`-style result dict per file, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(docx_files)
+        own_progress = progress is None
+        if own_progress:
+            progress = tqdm(total=len(docx_files), desc="Extracting", unit="file")
+        try:
+            for i, result in self._iter_extractions(docx_files, output_dir, max_workers):
+                results[i] = result
+                progress.update(1)
+        finally:
+            if own_progress:
+                progress.close()
+
+        self._embed_and_insert([result for result in results if result.get('success')], batch_size)
+        return results
+
+    def _embed_and_insert(self, extracted: List[Dict[str, Any]], batch_size: int = 100) -> None:
+        """
+        Embed and insert successfully extracted files, setting each one's `neo4j_insertion`.
+
+        The theory summaries are embedded in chunked `embed_batch` requests
+        instead of one request per file, and the graph data is written with a
+        single `insert_graph_data_batch` call. If that fails, each file is
+        inserted on its own.
+        """
+        if not extracted:
+            return
+
+        try:
+            summaries = [result['extraction_result'].extraction.summary for result in extracted]
+            to_embed = [i for i, summary in enumerate(summaries) if summary]
+            embeddings: List[List[float]] = [[] for _ in summaries]
+            for i, embedding in zip(to_embed, self.embedding_service.embed_batch(
+                    [summaries[i] for i in to_embed], batch_size=batch_size)):
+                embeddings[i] = embedding
+
+            batch = [
+                (
+                    self.neo4j_service.create_graph_data_from_extraction(
+                        extraction_result=result['extraction_result'],
+                        source_file=result['source_file'],
+                        theory_embedding=embedding
+                    ),
+                    result['source_file']
+                )
+                for result, embedding in zip(extracted, embeddings)
+            ]
+            insertions = self.neo4j_service.insert_graph_data_batch(batch)
+        except Exception as e:
+            logger.warning(f"Batched embedding/insertion failed, inserting per file: {e}")
+            insertions = []
+            for result in extracted:
+                try:
+                    graph_data = self.neo4j_service.create_graph_data_from_extraction(
+                        extraction_result=result['extraction_result'],
+                        source_file=result['source_file']
+                    )
+                    insertions.append(self.neo4j_service.insert_graph_data(
+                        graph_data=graph_data,
+                        source_file=result['source_file']
+                    ))
+                except Exception as insert_error:
+                    insertions.append(Neo4jInsertionResult(
+                        success=False,
+                        source_file=result['source_file'],
+                        error=str(insert_error)
+                    ))
+
+        for result, insertion in zip(extracted, insertions):
+            result['neo4j_insertion'] = insertion
+            if insertion.success:
+                logger.info(f"Successfully inserted into Neo4j: {insertion.nodes_created} nodes, {insertion.relationships_created} relationships")
+            else:
+                logger.warning(f"Neo4j insertion failed for {result['source_file']}: {insertion.error or 'Unknown error'}")
+
+    def _iter_extractions(self, docx_files: List[Path], output_dir: str,
+                          max_workers: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Extract each file without inserting it, yielding `(index, result)` as files finish.
+
+        With more than one worker, every file is submitted to a single process
+        pool, so workers build their LLM clients once and never sit idle waiting
+        for a slow file; results then arrive in completion order.
+        """
+        if max_workers <= 1 or len(docx_files) <= 1:
+            for i, docx_file in enumerate(docx_files):
+                yield i, self.process_single_document(
+                    docx_path=str(docx_file),
+                    output_dir=output_dir,
+                    insert_to_neo4j=False
+                )
+            return
+
+        # Spawned, not forked: the parent already holds the embedding cache's SQLite
+        # connection, pooled HTTP sockets and the Neo4j driver, none of which may be
+        # shared with a child process
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_extraction_worker,
+                                 initargs=(self.use_semantic_cache,),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                executor.submit(_extract_in_worker, str(docx_file), output_dir): i
+                for i, docx_file in enumerate(docx_files)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'success': False, 'source_file': str(docx_files[i]), 'error': str(e)}
+                yield i, result
+
     def process_batch_documents(self, input_directory: str, output_directory: str,
-                              clear_database: bool = False, generate_embeddings: bool = True) -> Dict[str, Any]:
+                              clear_database: bool = False, generate_embeddings: bool = True,
+                              max_workers: int = 1, force: bool = False) -> Dict[str, Any]:
         """
         Process multiple DOCX files from a specified directory using batch processing.
 
@@ -177,10 +368,16 @@ class IngestionService:
             output_directory: Base output directory for processed results
             clear_database: Whether to clear Neo4j database before batch processing
             generate_embeddings: Whether to generate embeddings for extracted concepts
+            max_workers: Number of DOCX files extracted in parallel processes
+            force: Re-process files already recorded in the output manifest
+
+        Files recorded in `<output_directory>/.processed.json` with an unchanged
+        mtime, whose extraction JSON still exists, are skipped so interrupted
+        runs resume where they stopped. Clearing the database resets the manifest.
 
         Returns:
-            Dictionary containing batch processing results with total files, successful/failed counts,
-            failed file list, and processing time
+            Dictionary containing batch processing results with total files, successful/failed/skipped
+            counts, failed file list, and processing time
         """
         start_time = time.time()
 
@@ -208,7 +405,7 @@ class IngestionService:
                 "processing_time": 0.0
             }
 
-        docx_files = list(input_path.glob("*.docx"))
+        docx_files = list_docx_files(input_directory)
         total_files = len(docx_files)
 
         if total_files == 0:
@@ -230,36 +427,63 @@ class IngestionService:
             logger.info("Clearing Neo4j database...")
             self.neo4j_service.clear_database()
 
+        # Skip files finished by an earlier run (their extraction JSON is still on disk)
+        manifest_path = Path(output_directory) / PROCESSED_MANIFEST_NAME
+        processed: Dict[str, str] = {}
+        if manifest_path.exists() and not (force or clear_database):
+            try:
+                processed = load_json_file(manifest_path)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+
+        keys = {docx_file: f"{docx_file}:{docx_file.stat().st_mtime_ns}" for docx_file in docx_files}
+        pending_files = [
+            docx_file for docx_file in docx_files
+            if not (keys[docx_file] in processed and Path(processed[keys[docx_file]]).exists())
+        ]
+        skipped = total_files - len(pending_files)
+        if skipped:
+            print(f"⏭️  Skipping {skipped} files already processed (see {manifest_path.name}, use --force to redo)")
+
         # Process each file
         successful = 0
         failed = 0
         failed_files: List[str] = []
 
-        for i, docx_file in enumerate(docx_files, 1):
-            filename = docx_file.name
-            logger.info(f"Processing {i}/{total_files}: {filename}")
-
-            try:
-                result = self.process_single_document(
-                    docx_path=str(docx_file),
-                    output_dir=output_directory,
-                    insert_to_neo4j=True,
-                    generate_embeddings=generate_embeddings
-                )
-
-                if result.get('success', False):
-                    successful += 1
-                    print(f"✅ Successfully processed: {filename}")
-                else:
-                    failed += 1
-                    failed_files.append(filename)
-                    error_msg = result.get('error', 'Unknown error')
-                    print(f"❌ Failed to process: {filename} - {error_msg}")
+        # Extraction runs in one pool for the whole run; every MANIFEST_FLUSH_EVERY
+        # finished files are embedded, inserted into Neo4j and recorded, so a crash
+        # loses little work
+        if pending_files:
+            self.warmup(max_workers=max_workers)
+
+        # One progress bar for the whole run; per-file lines go through tqdm.write
+        # so they print above the bar instead of breaking it
+        with tqdm(total=len(pending_files), desc="Processing", unit="file") as progress:
+            completed: List[Tuple[Path, Dict[str, Any]]] = []
+            for done, (i, result) in enumerate(
+                    self._iter_extractions(pending_files, output_directory, max_workers), 1):
+                progress.update(1)
+                completed.append((pending_files[i], result))
+                if len(completed) < MANIFEST_FLUSH_EVERY and done < len(pending_files):
+                    continue
+
+                self._embed_and_insert([result for _, result in completed if result.get('success')])
+                for docx_file, result in completed:
+                    filename = docx_file.name
+                    insertion = result.get('neo4j_insertion')
+                    if result.get('success', False):
+                        successful += 1
+                        tqdm.write(f"✅ Successfully processed: {filename}")
+                        if insertion is None or insertion.success:
+                            processed[keys[docx_file]] = result['saved_files']['extraction_json']
+                    else:
+                        failed += 1
+                        failed_files.append(filename)
+                        error_msg = result.get('error', 'Unknown error')
+                        tqdm.write(f"❌ Failed to process: {filename} - {error_msg}")
 
-            except Exception as e:
-                failed += 1
-                failed_files.append(filename)
-                logger.error(f"Error processing {filename}: {e}")
+                self._write_manifest(manifest_path, processed)
+                completed = []
 
         processing_time = time.time() - start_time
 
@@ -269,6 +493,7 @@ class IngestionService:
         print(f"📁 Total files: {total_files}")
         print(f"✅ Successful: {successful}")
         print(f"❌ Failed: {failed}")
+        print(f"⏭️  Skipped: {skipped}")
         print(f"⏱️  Processing time: {processing_time:.2f} seconds")
 
         if failed_files:
@@ -279,5 +504,15 @@ class IngestionService:
             "successful": successful,
             "failed": failed,
             "failed_files": failed_files,
+            "skipped": skipped,
             "processing_time": processing_time
         }
+
+    @staticmethod
+    def _write_manifest(manifest_path: Path, processed: Dict[str, str]) -> None:
+        """Atomically replace the processed-files manifest."""
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = manifest_path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(processed, f)
+        os.replace(temp_path, manifest_path)
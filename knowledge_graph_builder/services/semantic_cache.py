@@ -0,0 +1,190 @@
+"""
+Semantic extraction cache.
+
+Re-runs extract the same transcripts again, often with small edits, so a
+document's LLM extraction is reused instead of calling the model again. An
+extraction carries the document's topic and summary, so it is only reused for
+the same document: either the exact same text (matched by content hash), or a
+near-duplicate of an earlier version of the same source file (matched in
+embedding space). Normalized embeddings are kept in a float16 matrix and
+compared with a single matrix-vector product.
+
+Entries persist in one SQLite file, with each embedding stored in the same row
+as its extraction. Every `put` is a single atomic insert, so parallel
+extraction workers can share the cache: no worker overwrites another's
+entries, and a vector can never be paired with another document's extraction.
+Each instance picks up rows added by other processes before it searches.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .embedding_cache import get_cached_embedder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "lab_tutor" / "semantic_extraction"
+CACHE_DB_NAME = "extractions.sqlite3"
+
+
+def content_hash(text: str) -> str:
+    """Hex SHA-256 of a text, the key for exact reuse."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SemanticExtractionCache:
+    """Reuses extraction results for identical texts and near-duplicate versions of a source."""
+
+    def __init__(
+        self,
+        sim_threshold: float = 0.92,
+        cache_dir: Optional[str] = None,
+        embedding_service=None
+    ):
+        """
+        Load (or start) the cache.
+
+        Args:
+            sim_threshold: Minimum cosine similarity for an earlier version of the same
+                source to be reused
+            cache_dir: Directory for `extractions.sqlite3` (defaults to
+                LAB_TUTOR_SEMANTIC_CACHE env var or ~/.cache/lab_tutor/semantic_extraction)
+            embedding_service: Embedder for cache keys (the shared CachedEmbedder when omitted)
+        """
+        self.sim_threshold = sim_threshold
+        self.cache_dir = Path(cache_dir or os.getenv("LAB_TUTOR_SEMANTIC_CACHE", DEFAULT_CACHE_DIR))
+        self.db_path = self.cache_dir / CACHE_DB_NAME
+        self._embedding_service = embedding_service
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.matrix: Optional[np.ndarray] = None
+        self.extractions: List[Dict[str, Any]] = []
+        # Source file of each row in `matrix`, and content hash -> extraction
+        self.sources: List[Optional[str]] = []
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
+        # Highest row id already loaded into `matrix`
+        self._last_id = 0
+        self._refresh()
+
+    @property
+    def embedding_service(self):
+        """Get the embedding service instance."""
+        if self._embedding_service is None:
+            self._embedding_service = get_cached_embedder()
+        return self._embedding_service
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # WAL lets workers read while another one inserts; writers wait on the lock
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "content_hash TEXT NOT NULL, "
+                "source TEXT, "
+                "dim INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "extraction TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _refresh(self) -> None:
+        """Append rows written since the last refresh (by this or another process)."""
+        if self._conn is None and not self.db_path.exists():
+            return
+        try:
+            rows = self._connect().execute(
+                "SELECT id, content_hash, source, dim, vector, extraction "
+                "FROM extractions WHERE id > ? ORDER BY id",
+                (self._last_id,)
+            ).fetchall()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache in {self.cache_dir}: {e}")
+            return
+        if not rows:
+            return
+
+        vectors = [] if self.matrix is None else [self.matrix]
+        dim = None if self.matrix is None else self.matrix.shape[1]
+        for row_id, row_hash, source, row_dim, blob, extraction in rows:
+            extraction = json.loads(extraction)
+            self._by_hash[row_hash] = extraction
+            if row_dim != dim:
+                # The embedding model changed dimension; only the newer rows are comparable
+                vectors, self.extractions, self.sources, dim = [], [], [], row_dim
+            vectors.append(np.frombuffer(blob, dtype=np.float16).reshape(1, row_dim))
+            self.extractions.append(extraction)
+            self.sources.append(source)
+            self._last_id = row_id
+        self.matrix = np.vstack(vectors)
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.embedding_service.embed_text(text), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    @staticmethod
+    def _source_key(source: Optional[str]) -> Optional[str]:
+        return os.path.abspath(source) if source else None
+
+    def get(self, text: str, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached extraction for this document.
+
+        An identical text is reused from any source. Otherwise only earlier
+        versions of `source` are compared, since another document's topic and
+        summary never describe this one.
+
+        Returns:
+            The cached extraction dict, or None when nothing matches
+        """
+        self._refresh()
+        extraction = self._by_hash.get(content_hash(text))
+        if extraction is not None:
+            logger.info("Semantic cache hit (identical text)")
+            return extraction
+
+        source = self._source_key(source)
+        if source is None or self.matrix is None:
+            return None
+        candidates = [i for i, row_source in enumerate(self.sources) if row_source == source]
+        if not candidates:
+            return None
+        query = self._embed(text)
+        if query.shape[0] != self.matrix.shape[1]:
+            return None
+        similarities = self.matrix[candidates].astype(np.float32) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.sim_threshold:
+            return None
+        logger.info(f"Semantic cache hit for an earlier version of {source} (similarity {similarities[best]:.3f})")
+        return self.extractions[candidates[best]]
+
+    def put(self, text: str, extraction: Dict[str, Any], source: Optional[str] = None) -> None:
+        """Add the extraction of a text from `source`; the row is committed on its own."""
+        row = self._embed(text).astype(np.float16)
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO extractions (content_hash, source, dim, vector, extraction) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (content_hash(text), self._source_key(source), row.shape[0], row.tobytes(),
+                 json.dumps(extraction, ensure_ascii=False))
+            )
+        self._refresh()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
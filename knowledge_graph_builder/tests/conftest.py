@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The builder's modules import each other as top-level packages (`services`,
+# `models`, ...), the way its scripts run from the knowledge_graph_builder folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,96 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from services.embedding import EmbeddingService
+from services.embedding_cache import TOUCH_INTERVAL, CachedEmbedder, LRUEmbeddingCache
+
+
+class LRUEmbeddingCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmp.name) / "embeddings.sqlite3")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def make_cache(self, **kwargs) -> LRUEmbeddingCache:
+        cache = LRUEmbeddingCache(path=self.path, **kwargs)
+        self.addCleanup(cache._conn.close)
+        return cache
+
+
+class TestTTL(LRUEmbeddingCacheTestCase):
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = self.make_cache(ttl=60)
+        key = cache.make_key("m", "text")
+        with mock.patch("services.embedding_cache.time.time", return_value=1_000):
+            cache.put_many("m", [(key, [0.5, 0.25])])
+        with mock.patch("services.embedding_cache.time.time", return_value=1_060):
+            self.assertEqual(cache.get_many([key]), [[0.5, 0.25]])
+        with mock.patch("services.embedding_cache.time.time", return_value=1_061):
+            self.assertEqual(cache.get_many([key]), [None])
+
+
+class TestLRUEviction(LRUEmbeddingCacheTestCase):
+    def test_evicts_least_recently_used_beyond_capacity(self) -> None:
+        cache = self.make_cache(capacity=2, ttl=10 * TOUCH_INTERVAL)
+        a, b, c = (cache.make_key("m", text) for text in ("a", "b", "c"))
+        with mock.patch("services.embedding_cache.time.time", return_value=1_000):
+            cache.put_many("m", [(a, [1.0])])
+        with mock.patch("services.embedding_cache.time.time", return_value=2_000):
+            cache.put_many("m", [(b, [2.0])])
+        # Reading `a` after TOUCH_INTERVAL makes it more recent than `b`
+        later = 2_000 + TOUCH_INTERVAL
+        with mock.patch("services.embedding_cache.time.time", return_value=later):
+            self.assertEqual(cache.get_many([a]), [[1.0]])
+        with mock.patch("services.embedding_cache.time.time", return_value=later + 1):
+            cache.put_many("m", [(c, [3.0])])
+            self.assertEqual(cache.get_many([a, b, c]), [[1.0], None, [3.0]])
+
+    def test_no_eviction_at_capacity(self) -> None:
+        cache = self.make_cache(capacity=2)
+        keys = [cache.make_key("m", text) for text in ("a", "b")]
+        cache.put_many("m", [(key, [1.0]) for key in keys])
+        self.assertEqual(cache.get_many(keys), [[1.0], [1.0]])
+
+
+class TestKeyNormalization(LRUEmbeddingCacheTestCase):
+    def test_exact_key_keeps_case_and_punctuation(self) -> None:
+        cache = self.make_cache()
+        self.assertEqual(cache.make_key("m", " Apple "), cache.make_key("m", "Apple"))
+        self.assertNotEqual(cache.make_key("m", "Apple"), cache.make_key("m", "apple"))
+        self.assertNotEqual(cache.make_key("m1", "apple"), cache.make_key("m2", "apple"))
+
+    def test_normalized_key_ignores_case_spacing_and_trailing_punctuation(self) -> None:
+        cache = self.make_cache()
+        self.assertEqual(
+            cache.make_normalized_key("m", "Data   Warehousing."),
+            cache.make_normalized_key("m", "data warehousing")
+        )
+        # Never collides with an exact key
+        self.assertNotEqual(cache.make_normalized_key("m", "apple"), cache.make_key("m", "apple"))
+
+    def test_normalization_can_be_disabled(self) -> None:
+        self.assertIsNone(self.make_cache(normalize_keys=False).make_normalized_key("m", "Apple"))
+
+    def test_exact_entry_wins_over_normalized_fallback(self) -> None:
+        embedder = CachedEmbedder(cache=self.make_cache(), api_key="test")
+        self.addCleanup(embedder.close)
+        calls = []
+
+        def embed(_, texts):
+            calls.append(list(texts))
+            return [[float(len(calls))] for _ in texts]
+
+        with mock.patch.object(EmbeddingService, "embed_documents", embed):
+            self.assertEqual(embedder.embed_documents(["Apple"]), [[1.0]])
+            # Only a normalized entry exists for "apple."
+            self.assertEqual(embedder.embed_documents(["apple."]), [[1.0]])
+            self.assertEqual(embedder.embed_documents(["apple"]), [[1.0]])
+        self.assertEqual(calls, [["Apple"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import unittest
+from unittest import mock
+
+from models.langgraph_state_models import MergeBatch, WorkflowConfiguration
+from models.neo4j_models import RelationshipBatch
+from services.enhanced_langgraph_service import (
+    MAX_COMPLETION_TOKENS,
+    MIN_COMPLETION_TOKENS,
+    EnhancedRelationshipService,
+)
+
+
+def make_service(**config) -> EnhancedRelationshipService:
+    config.setdefault("verbose_logging", False)
+    config.setdefault("debug_dump_iterations", False)
+    config.setdefault("relationship_types", {"USED_FOR": "Tool for a purpose", "RELATED_TO": "General association"})
+    with mock.patch.dict(os.environ, {"LAB_TUTOR_LLM_API_KEY": "test"}):
+        return EnhancedRelationshipService(
+            neo4j_service=None, config=WorkflowConfiguration(**config), use_llm_cache=False
+        )
+
+
+def concepts(n):
+    return [{"name": f"c{i:02}"} for i in range(n)]
+
+
+class TestConceptShards(unittest.TestCase):
+    def test_single_shard_when_unset_or_small(self) -> None:
+        self.assertEqual(make_service()._concept_shards(concepts(30)), [concepts(30)])
+        self.assertEqual(
+            make_service(generation_shard_size=30)._concept_shards(concepts(30)), [concepts(30)]
+        )
+
+    def test_overlapping_windows_cover_every_concept(self) -> None:
+        service = make_service(generation_shard_size=10, generation_shard_overlap=3)
+        shards = service._concept_shards(concepts(25))
+        self.assertEqual([shard[0]["name"] for shard in shards], ["c00", "c07", "c14", "c21"])
+        self.assertEqual([len(shard) for shard in shards], [10, 10, 10, 4])
+        self.assertEqual(shards[-1][-1]["name"], "c24")
+        for previous, current in zip(shards, shards[1:]):
+            self.assertEqual(previous[-3:], current[:3])
+
+    def test_overlap_capped_at_half_a_shard(self) -> None:
+        service = make_service(generation_shard_size=4, generation_shard_overlap=10)
+        shards = service._concept_shards(concepts(8))
+        self.assertEqual([shard[0]["name"] for shard in shards], ["c00", "c02", "c04"])
+
+
+class TestOutputBudget(unittest.TestCase):
+    def test_initial_budgets(self) -> None:
+        service = make_service()
+        self.assertEqual(service._output_budget(RelationshipBatch), MAX_COMPLETION_TOKENS)
+        self.assertEqual(service._output_budget(MergeBatch), 2048)
+
+    def test_follows_largest_batch_in_1024_steps(self) -> None:
+        service = make_service()
+        service._record_output(MergeBatch, 0)
+        self.assertEqual(service._output_budget(MergeBatch), MIN_COMPLETION_TOKENS)
+        service._record_output(MergeBatch, 20)
+        # 120 tokens per item * (20 * 1.5 + 1) = 3720, rounded up to 4096
+        self.assertEqual(service._output_budget(MergeBatch), 4096)
+        service._record_output(MergeBatch, 5)
+        self.assertEqual(service._output_budget(MergeBatch), 4096)
+        service._record_output(RelationshipBatch, 500)
+        self.assertEqual(service._output_budget(RelationshipBatch), MAX_COMPLETION_TOKENS)
+
+    def test_full_budget_after_truncation(self) -> None:
+        service = make_service()
+        service._record_output(MergeBatch, 1)
+        service._full_budget.add(MergeBatch)
+        self.assertEqual(service._output_budget(MergeBatch), MAX_COMPLETION_TOKENS)
+
+
+if __name__ == "__main__":
+    unittest.main()
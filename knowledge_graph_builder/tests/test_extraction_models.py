@@ -0,0 +1,44 @@
+import unittest
+
+from models.extraction_models import CompactCanonicalExtractionResult
+
+HEADER = {
+    "topic": "Databases",
+    "summary": "Relational and NoSQL storage.",
+    "keywords": ["sql", "nosql", "index", "schema", "query"],
+}
+
+
+def to_canonical(concepts):
+    return CompactCanonicalExtractionResult(**HEADER, concepts=concepts).to_canonical()
+
+
+class TestCompactToCanonical(unittest.TestCase):
+    def test_maps_positional_fields(self) -> None:
+        result = to_canonical([["SQL", "A query language", "SQL is used to query"]])
+        concept = result.concepts[0]
+        self.assertEqual(
+            (concept.name, concept.definition, concept.text_evidence),
+            ("SQL", "A query language", "SQL is used to query")
+        )
+        self.assertEqual(result.topic, HEADER["topic"])
+        self.assertEqual(result.keywords, HEADER["keywords"])
+
+    def test_pads_short_rows(self) -> None:
+        concept = to_canonical([["Index"]]).concepts[0]
+        self.assertEqual((concept.name, concept.definition, concept.text_evidence), ("Index", "", ""))
+
+    def test_truncates_long_rows(self) -> None:
+        concept = to_canonical([["Schema", "Structure", "the schema", "extra"]]).concepts[0]
+        self.assertEqual(
+            (concept.name, concept.definition, concept.text_evidence),
+            ("Schema", "Structure", "the schema")
+        )
+
+    def test_drops_rows_without_a_name(self) -> None:
+        result = to_canonical([[], ["", "No name"], ["NoSQL", "Non-relational"]])
+        self.assertEqual([concept.name for concept in result.concepts], ["NoSQL"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,99 @@
+import os
 import re
-from langchain_community.document_loaders import Docx2txtLoader
+import zipfile
 from langchain_core.documents import Document
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import json
+from typing import Dict, Any, Iterator, Optional, List
+
+from lxml import etree
+
+import ijson
+import orjson
+
+
+def list_docx_files(directory: str) -> List[Path]:
+    """
+    List the DOCX files directly inside a directory.
+
+    Uses a single os.scandir pass; dirent types answer the is_file check
+    without a stat per entry. Entries of one directory are already unique, so
+    no dedupe pass is needed; the result is sorted once on the entry names.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Paths of the .docx files in the directory, sorted by file name
+    """
+    with os.scandir(directory) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(".docx") and entry.is_file()
+        )
+    return [Path(directory, name) for name in names]
+
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_T, _W_TAB, _W_BR, _W_CR = (_W_NS + tag for tag in ("p", "t", "tab", "br", "cr"))
+_DOCX_HEADER_RE = re.compile(r"word/header[0-9]*\.xml")
+_DOCX_FOOTER_RE = re.compile(r"word/footer[0-9]*\.xml")
+
+
+def _iter_docx_part(part) -> Iterator[str]:
+    """Stream the text fragments of one WordprocessingML part, clearing parsed paragraphs."""
+    for event, element in etree.iterparse(part, events=("start", "end"), tag=(_W_P, _W_T, _W_TAB, _W_BR, _W_CR)):
+        tag = element.tag
+        if event == "start":
+            if tag == _W_P:
+                yield "\n\n"
+            elif tag == _W_TAB:
+                yield "\t"
+            elif tag != _W_T:
+                yield "\n"
+        elif tag == _W_T:
+            if element.text:
+                yield element.text
+        elif tag == _W_P:
+            element.clear()
+
+
+def iter_docx_text(docx_path: str) -> Iterator[str]:
+    """
+    Stream the text of a DOCX file as fragments.
+
+    Produces the same text as docx2txt (headers, body, then footers, with
+    paragraphs separated by blank lines) but parses each XML part with lxml's
+    incremental parser instead of building the whole DOM.
+
+    Args:
+        docx_path: Path to the DOCX file
+
+    Yields:
+        Text fragments in document order
+    """
+    with zipfile.ZipFile(docx_path) as docx_zip:
+        names = docx_zip.namelist()
+        parts = (
+            [name for name in names if _DOCX_HEADER_RE.match(name)]
+            + ["word/document.xml"]
+            + [name for name in names if _DOCX_FOOTER_RE.match(name)]
+        )
+        for name in parts:
+            with docx_zip.open(name) as part:
+                yield from _iter_docx_part(part)
+
+
+def _load_docx(docx_path: Path) -> List[Document]:
+    """Load one DOCX file as a Document with source metadata."""
+    text = "".join(iter_docx_text(str(docx_path))).strip()
+    return [Document(
+        page_content=text,
+        metadata={
+            'source': str(docx_path),
+            'source_file': str(docx_path),
+            'source_filename': docx_path.name,
+        }
+    )]
 
 
 def load_docx_documents(files_directory: str) -> list[Document]:
@@ -19,29 +109,17 @@ def load_docx_documents(files_directory: str) -> list[Document]:
     Raises:
         FileNotFoundError: If no DOCX files are found in the directory
     """
-    dir_path = Path(files_directory)
-
     # Find all .docx files in the directory
-    docx_files = list(dir_path.glob("*.docx"))
+    docx_files = list_docx_files(files_directory)
 
     if not docx_files:
         raise FileNotFoundError("No DOCX files found in the directory")
 
     documents = []
 
-    # Load all DOCX files and add source metadata
+    # Load all DOCX files with source metadata
     for docx_file in docx_files:
-        loader = Docx2txtLoader(str(docx_file))
-        docs = loader.load()
-
-        # Add source file path to document metadata
-        for doc in docs:
-            if not doc.metadata:
-                doc.metadata = {}
-            doc.metadata['source_file'] = str(docx_file)
-            doc.metadata['source_filename'] = docx_file.name
-
-        documents.extend(docs)
+        documents.extend(_load_docx(docx_file))
 
     return documents
 
@@ -64,17 +142,7 @@ def load_single_docx_document(file_path: str) -> List[Document]:
     if not docx_path.exists():
         raise FileNotFoundError(f"DOCX file not found: {file_path}")
 
-    loader = Docx2txtLoader(str(docx_path))
-    docs = loader.load()
-
-    # Add source file path to document metadata
-    for doc in docs:
-        if not doc.metadata:
-            doc.metadata = {}
-        doc.metadata['source_file'] = str(docx_path)
-        doc.metadata['source_filename'] = docx_path.name
-
-    return docs
+    return _load_docx(docx_path)
 
 
 def find_original_docx(json_filename: str, docx_directory: str) -> Optional[str]:
@@ -112,15 +180,10 @@ def load_and_preprocess_docx(docx_path: str, extraction_service) -> str:
     """
     try:
         # Load DOCX content
-        loader = Docx2txtLoader(docx_path)
-        documents = loader.load()
-        
-        if not documents:
+        raw_text = "".join(iter_docx_text(docx_path)).strip()
+        if not raw_text:
             return ""
         
-        # Combine all document content
-        raw_text = "\n".join([doc.page_content for doc in documents])
-        
         # Preprocess using extraction service
         preprocessed_text = extraction_service.preprocess_text(raw_text)
         
@@ -134,6 +197,8 @@ def load_and_preprocess_docx(docx_path: str, extraction_service) -> str:
 def load_json_file(json_path: str) -> Dict[str, Any]:
     """
     Load JSON file and return parsed data.
+
+    Parses the raw bytes with orjson.
     
     Args:
         json_path: Path to the JSON file
@@ -141,8 +206,32 @@ def load_json_file(json_path: str) -> Dict[str, Any]:
     Returns:
         Parsed JSON data
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(json_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def count_json_array_items(json_path: str, keys: List[str]) -> Dict[str, int]:
+    """
+    Count the items of top-level JSON arrays without loading the whole file.
+
+    Streams parse events with ijson so only the counters are held in memory.
+
+    Args:
+        json_path: Path to the JSON file
+        keys: Top-level keys whose array lengths should be counted
+
+    Returns:
+        Mapping of key to item count (0 for missing keys)
+    """
+    counts = {key: 0 for key in keys}
+
+    item_prefixes = {f"{key}.item": key for key in keys}
+    with open(json_path, 'rb') as f:
+        for prefix, event, _ in ijson.parse(f):
+            key = item_prefixes.get(prefix)
+            if key is not None and event not in ('map_key', 'end_map', 'end_array'):
+                counts[key] += 1
+    return counts
 
 
 def ensure_embeddings_exist(data: Dict[str, Any], embedding_service) -> Dict[str, Any]:
@@ -6,6 +6,7 @@ state transitions, and quality metrics progression.
 """
 
 import json
+from collections import Counter
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -271,10 +272,7 @@ def print_relationship_type_distribution(relationships: List[Dict]):
         return
     
     # Count relationship types
-    type_counts = {}
-    for rel in relationships:
-        rel_type = rel.get("relation", "UNKNOWN")
-        type_counts[rel_type] = type_counts.get(rel_type, 0) + 1
+    type_counts = Counter(rel.get("relation", "UNKNOWN") for rel in relationships)
     
     # Print distribution
     print("\n📊 Relationship Type Distribution")
@@ -284,7 +282,7 @@ def print_relationship_type_distribution(relationships: List[Dict]):
     max_count = max(type_counts.values())
     chart_width = 50
     
-    for rel_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
+    for rel_type, count in type_counts.most_common():
         percentage = (count / total) * 100
         bar_length = int((count / max_count) * chart_width)
         bar = "█" * bar_length
@@ -10,12 +10,16 @@ It handles:
 5. Graph construction from our construction plan format
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
-import json
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import logging
+import threading
+from functools import cache, lru_cache
 from dotenv import load_dotenv
 
 from langchain_neo4j import Neo4jGraph
@@ -32,24 +36,55 @@ from knowledge_graph_builder.models.neo4j_models import (
     Neo4jInsertionResult
 )
 from knowledge_graph_builder.services.embedding import EmbeddingService
+from knowledge_graph_builder.services.embedding_cache import get_cached_embedder
+from knowledge_graph_builder.utils.doc_utils import load_json_file
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-
-def normalize_concept_name(concept_name: str) -> str:
-    """Normalize concept names to canonical lowercase forms.
-
-    This is used to enforce a stable identity for CONCEPT nodes across insertions.
-    """
-    if not concept_name:
-        return concept_name
-
-    original = concept_name.strip()
-
-    # Remove common redundant suffixes and patterns
-    redundant_patterns = [
+# Connection pool sized for the threaded JSON ingestion; every query reuses
+# pooled connections on the one driver owned by Neo4jGraph.
+DEFAULT_DRIVER_CONFIG = {
+    "max_connection_pool_size": 32,
+    "connection_acquisition_timeout": 60,
+}
+
+# Batched equivalents of Neo4jGraph.add_graph_documents' apoc.merge.* queries,
+# specialised per label / relationship type. The schema is small and fixed, so
+# each shape compiles to one static query string that Neo4j plans once and
+# reuses from its plan cache, with no per-row dynamic label dispatch.
+def _cypher_name(name: str) -> str:
+    """Backtick-quote a label or relationship type for interpolation into Cypher."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+@cache
+def _node_merge_query(label: str) -> str:
+    return (
+        "UNWIND $data AS row "
+        f"MERGE (node:{_cypher_name(label)} {{id: row.id}}) "
+        "ON CREATE SET node += row.properties"
+    )
+
+
+@cache
+def _relationship_merge_query(source_label: str, rel_type: str, target_label: str) -> str:
+    return (
+        "UNWIND $data AS row "
+        f"MERGE (source:{_cypher_name(source_label)} {{id: row.source}}) "
+        f"MERGE (target:{_cypher_name(target_label)} {{id: row.target}}) "
+        f"MERGE (source)-[rel:{_cypher_name(rel_type)}]->(target) "
+        "ON CREATE SET rel += row.properties"
+    )
+
+
+# Redundant suffixes stripped from concept names, applied in order (one name can
+# lose several, e.g. "Data Processing Framework" -> "Data Processing" -> "Data").
+# Compiled once; normalization runs for every concept of every ingested file.
+_REDUNDANT_CONCEPT_SUFFIXES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"\s+(Strategy|Strategies)$",
         r"\s+(Model|Models)$",
         r"\s+(Framework|Frameworks)$",
@@ -64,14 +99,30 @@ def normalize_concept_name(concept_name: str) -> str:
         r"\s+(Computing|Computation)$",
         r"\s+Crawling\s+Strategy$",  # Specific to web crawler examples
         r"\s+Analysis\s+(Framework|Model)$",
-    ]
+    )
+)
+_WHITESPACE_RE = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=65536)
+def normalize_concept_name(concept_name: str) -> str:
+    """Normalize concept names to canonical lowercase forms.
+
+    This is used to enforce a stable identity for CONCEPT nodes across insertions.
+    Results are memoized: the same concept names recur across files.
+    """
+    if not concept_name:
+        return concept_name
+
+    original = concept_name.strip()
+
+    # Remove common redundant suffixes and patterns
     normalized = original
-    for pattern in redundant_patterns:
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+    for pattern in _REDUNDANT_CONCEPT_SUFFIXES:
+        normalized = pattern.sub("", normalized)
 
     # Clean up extra whitespace and enforce lowercase
-    normalized = re.sub(r"\s+", " ", normalized).strip().casefold()
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip().casefold()
 
     # If normalization resulted in empty, fall back to the lowercased original
     return normalized if normalized else original.casefold()
@@ -86,7 +137,8 @@ class Neo4jService:
         username: Optional[str] = None,
         password: Optional[str] = None,
         database: str = "neo4j",
-        embedding_service: Optional[EmbeddingService] = None
+        embedding_service: Optional[EmbeddingService] = None,
+        driver_config: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize Neo4j service with connection parameters.
@@ -96,7 +148,9 @@ class Neo4jService:
             username: Database username (defaults to NEO4J_USERNAME env var or neo4j)
             password: Database password (defaults to NEO4J_PASSWORD env var or password)
             database: Database name
-            embedding_service: Optional embedding service instance
+            embedding_service: Optional embedding service instance (defaults to the
+                shared disk-cached embedder)
+            driver_config: Overrides for DEFAULT_DRIVER_CONFIG (neo4j driver options)
         """
         # Use environment variables or defaults
         self.url = url or os.getenv("NEO4J_URI", "bolt://localhost:7687")
@@ -105,7 +159,7 @@ class Neo4jService:
         self.database = database
 
         # Initialize embedding service
-        self.embedding_service = embedding_service or EmbeddingService()
+        self.embedding_service = embedding_service or get_cached_embedder()
 
         # Initialize Neo4j connection
         try:
@@ -113,7 +167,8 @@ class Neo4jService:
                 url=self.url,
                 username=self.username,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                driver_config={**DEFAULT_DRIVER_CONFIG, **(driver_config or {})}
             )
             logger.info(f"Connected to Neo4j at {self.url}")
         except Exception as e:
@@ -136,8 +191,9 @@ class Neo4jService:
         constraints = [
             "CREATE CONSTRAINT teacher_uploaded_document_id_unique IF NOT EXISTS FOR (d:TEACHER_UPLOADED_DOCUMENT) REQUIRE d.id IS UNIQUE",
             "CREATE CONSTRAINT quiz_question_id_unique IF NOT EXISTS FOR (q:QUIZ_QUESTION) REQUIRE q.id IS UNIQUE",
-            # Note: CONCEPT nodes should be shared across documents, so we use MERGE instead of unique constraint
-            # "CREATE CONSTRAINT concept_name_unique IF NOT EXISTS FOR (c:CONCEPT) REQUIRE c.name IS UNIQUE"
+            # CONCEPT nodes are shared across documents and MERGEd on id; the constraint keeps
+            # concurrent ingestions of the same concept from each creating a node
+            "CREATE CONSTRAINT concept_id_unique IF NOT EXISTS FOR (c:CONCEPT) REQUIRE c.id IS UNIQUE",
         ]
         
         # Regular indexes for performance
@@ -201,13 +257,32 @@ class Neo4jService:
         
         logger.info("Database setup complete")
     
-    def process_topic_json_file(self, json_file_path: Union[str, Path]) -> bool:
+    def has_concept_id_constraint(self) -> bool:
+        """Whether CONCEPT.id is backed by a uniqueness constraint (required for concurrent ingestion)."""
+        try:
+            result = self.graph.query(
+                "SHOW CONSTRAINTS YIELD labelsOrTypes, properties, type "
+                "WHERE labelsOrTypes = ['CONCEPT'] AND properties = ['id'] "
+                "AND type IN ['UNIQUENESS', 'NODE_PROPERTY_UNIQUENESS', 'NODE_KEY'] "
+                "RETURN count(*) AS count"
+            )
+        except Exception as e:
+            logger.warning(f"Could not list constraints: {e}")
+            return False
+        return bool(result and result[0]['count'])
+    
+    def process_topic_json_file(
+        self,
+        json_file_path: Union[str, Path],
+        data: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Process a single Neo4j-ready JSON file from a topic folder.
         Handles concept deduplication and constraint conflicts gracefully.
 
         Args:
             json_file_path: Path to the Neo4j-ready JSON file
+            data: Already-parsed file contents, if the caller loaded them
 
         Returns:
             True if successful, False otherwise
@@ -216,9 +291,9 @@ class Neo4jService:
             json_path = Path(json_file_path)
             logger.info(f"Processing: {json_path.name}")
 
-            # Load JSON data
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Load JSON data unless the caller already prefetched it
+            if data is None:
+                data = load_json_file(json_path)
 
             # Validate data structure
             if 'nodes' not in data or 'relationships' not in data:
@@ -375,7 +450,11 @@ class Neo4jService:
             return results
 
         # Find all JSON files in neo4j_ready directory
-        json_files = list(neo4j_ready_dir.glob("*.json"))
+        with os.scandir(neo4j_ready_dir) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
 
         if not json_files:
             logger.warning(f"No JSON files found in {neo4j_ready_dir}")
@@ -383,33 +462,65 @@ class Neo4jService:
 
         logger.info(f"Processing topic folder: {topic_path.name} - Found {len(json_files)} JSON files")
 
-        # Process each JSON file
-        for json_file in json_files:
-            if self.process_topic_json_file(json_file):
-                results['processed_files'].append(str(json_file.name))
+        # Parse files on a background thread while earlier ones are validated
+        prefetched = queue.Queue(maxsize=2)
 
-                # Count nodes and relationships
+        def prefetch():
+            for json_file in json_files:
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    results['total_nodes'] += len(data.get('nodes', []))
-                    results['total_relationships'] += len(data.get('relationships', []))
+                    prefetched.put((json_file, load_json_file(json_file)))
                 except Exception as e:
-                    logger.warning(f"Error counting data in {json_file.name}: {e}")
-            else:
+                    logger.error(f"Error reading {json_file}: {e}")
+                    prefetched.put((json_file, None))
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+        # Validate and convert each file, then write the whole topic in one bulk ingest
+        loaded = []
+        for _ in json_files:
+            json_file, data = prefetched.get()
+            if data is None or 'nodes' not in data or 'relationships' not in data:
+                logger.error(f"Invalid JSON structure in {json_file.name}")
                 results['failed_files'].append(str(json_file.name))
+                continue
+            loaded.append((json_file, data))
+
+        try:
+            self.bulk_ingest([
+                self._create_graph_document_from_construction_plan(data) for _, data in loaded
+            ])
+            ingested = loaded
+        except Exception as e:
+            logger.warning(f"Bulk ingest of {topic_path.name} failed, retrying per file: {e}")
+            ingested = []
+            for json_file, data in loaded:
+                if self.process_topic_json_file(json_file, data=data):
+                    ingested.append((json_file, data))
+                else:
+                    results['failed_files'].append(str(json_file.name))
+
+        for json_file, data in ingested:
+            results['processed_files'].append(str(json_file.name))
+            results['total_nodes'] += len(data.get('nodes', []))
+            results['total_relationships'] += len(data.get('relationships', []))
 
         return results
 
-    def ingest_all_topics(self, base_output_dir: Union[str, Path]) -> Dict[str, Any]:
+    def ingest_all_topics(self, base_output_dir: Union[str, Path], max_workers: int = 8) -> Dict[str, Any]:
         """
         Ingest all topic folders from the base output directory.
 
+        Topic folders are ingested concurrently; each worker's writes borrow
+        sessions from the driver's shared connection pool. Topics share CONCEPT
+        nodes, so without the CONCEPT.id uniqueness constraint (e.g. when it could
+        not be created over existing duplicates) topics are ingested one at a time.
+
         Args:
             base_output_dir: Base directory containing topic folders
+            max_workers: Number of topic folders ingested at the same time
 
         Returns:
-            Complete ingestion results
+            Complete ingestion results (topics reported in folder order)
         """
         base_path = Path(base_output_dir)
 
@@ -419,9 +530,11 @@ class Neo4jService:
 
         # Find all topic folders (directories that contain neo4j_ready subdirectories)
         topic_folders = []
-        for item in base_path.iterdir():
-            if item.is_dir() and (item / "neo4j_ready").exists():
-                topic_folders.append(item)
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "neo4j_ready")):
+                    topic_folders.append(Path(entry.path))
+        topic_folders.sort()
 
         if not topic_folders:
             logger.warning(f"No topic folders found in {base_path}")
@@ -432,6 +545,9 @@ class Neo4jService:
         # Clear database and set up constraints
         self.clear_database()
         self.create_constraints_and_indexes()
+        if max_workers > 1 and not self.has_concept_id_constraint():
+            logger.warning("CONCEPT.id uniqueness constraint missing - ingesting topics sequentially")
+            max_workers = 1
 
         # Process each topic folder
         ingestion_results = {
@@ -444,11 +560,28 @@ class Neo4jService:
             'total_relationships': 0
         }
 
-        for topic_folder in topic_folders:
-            logger.info(f"Processing topic: {topic_folder.name}")
-
-            topic_result = self.process_topic_folder(topic_folder)
-
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.process_topic_folder, topic_folder)
+                for topic_folder in topic_folders
+            ]
+            # Collect in folder order so the report does not depend on completion order
+            topic_results = []
+            for topic_folder, future in zip(topic_folders, futures):
+                try:
+                    topic_results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Error processing topic {topic_folder.name}: {e}")
+                    topic_results.append({
+                        'topic_folder': topic_folder.name,
+                        'processed_files': [],
+                        'failed_files': [topic_folder.name],
+                        'total_nodes': 0,
+                        'total_relationships': 0
+                    })
+                logger.info(f"Processed topic: {topic_folder.name}")
+
+        for topic_result in topic_results:
             if topic_result['processed_files']:
                 ingestion_results['topics_processed'].append(topic_result)
                 ingestion_results['total_files_processed'] += len(topic_result['processed_files'])
@@ -1047,7 +1180,12 @@ class Neo4jService:
             logger.error(f"Error retrieving sample questions: {e}")
             return []
 
-    def create_graph_data_from_extraction(self, extraction_result, source_file: str) -> Neo4jGraphData:
+    def create_graph_data_from_extraction(
+        self,
+        extraction_result,
+        source_file: str,
+        theory_embedding: Optional[List[float]] = None
+    ) -> Neo4jGraphData:
         """
         Create Pydantic-based Neo4j graph data from LangChain extraction result.
 
@@ -1057,32 +1195,85 @@ class Neo4jService:
         Args:
             extraction_result: CompleteExtractionResult from LangChain extraction
             source_file: Path to source DOCX file
+            theory_embedding: Precomputed summary embedding (e.g. from a batched
+                request); generated here when omitted
 
         Returns:
             Neo4jGraphData with type-safe Pydantic models
         """
         # Extract data from LangChain result
         extraction = extraction_result.extraction
-        topic_name = extraction.topic
-        summary_text = extraction.summary
-        keywords_data = extraction.keywords
-        concepts_data = extraction.concepts
 
-        # Get original text from extraction result
-        original_text = getattr(extraction, 'original_text', '')
+        return self._build_graph_data(
+            topic_name=extraction.topic,
+            summary_text=extraction.summary,
+            keywords_data=extraction.keywords,
+            concepts_data=[
+                (concept.name, concept.definition, concept.text_evidence)
+                for concept in extraction.concepts
+            ],
+            original_text=getattr(extraction, 'original_text', ''),
+            source_file=source_file,
+            theory_embedding=theory_embedding
+        )
+
+    def create_graph_data_from_dict(
+        self,
+        data: Dict[str, Any],
+        source_file: str,
+        default_topic: Optional[str] = None
+    ) -> Neo4jGraphData:
+        """
+        Create Neo4j graph data straight from a saved extraction JSON dict.
+
+        Skips building extraction models for data that was already validated
+        when it was extracted.
+
+        Args:
+            data: Parsed extraction JSON (topic, summary, keywords, concepts)
+            source_file: Path to the extraction JSON file
+            default_topic: Topic to use when the JSON has none
+
+        Returns:
+            Neo4jGraphData with type-safe Pydantic models
+        """
+        return self._build_graph_data(
+            topic_name=data.get('topic', default_topic),
+            summary_text=data.get('summary', ''),
+            keywords_data=data.get('keywords', []),
+            concepts_data=[
+                (c.get('name', ''), c.get('definition', ''), c.get('text_evidence', ''))
+                for c in data.get('concepts', [])
+            ],
+            original_text=data.get('original_text', ''),
+            source_file=source_file
+        )
+
+    def _build_graph_data(
+        self,
+        topic_name: Optional[str],
+        summary_text: str,
+        keywords_data: List[str],
+        concepts_data: List[Tuple[str, str, str]],
+        original_text: str,
+        source_file: str,
+        theory_embedding: Optional[List[float]] = None
+    ) -> Neo4jGraphData:
+        """Build the document node, canonical CONCEPT nodes and MENTIONS relationships."""
 
         # Generate unique IDs
         source_filename = Path(source_file).name
         theory_id = f"theory_{Path(source_file).stem}"
 
-        # Generate embedding for the theory (compressed text/summary)
-        theory_embedding = []
-        if summary_text:
-            try:
-                theory_embedding = self.embedding_service.embed_text(summary_text)
-            except Exception as e:
-                logger.warning(f"Failed to generate theory embedding: {e}")
-                theory_embedding = []
+        # Generate embedding for the theory (compressed text/summary) unless precomputed
+        if theory_embedding is None:
+            theory_embedding = []
+            if summary_text:
+                try:
+                    theory_embedding = self.embedding_service.embed_text(summary_text)
+                except Exception as e:
+                    logger.warning(f"Failed to generate theory embedding: {e}")
+                    theory_embedding = []
 
         # Create lists for Pydantic models
         nodes = []
@@ -1108,9 +1299,9 @@ class Neo4jService:
         # 2. CONCEPT Nodes (canonical approach - no duplicates)
         canonical_concepts = {}  # Track canonical concepts to avoid duplicates
 
-        for concept in concepts_data:
+        for concept_name, definition, text_evidence in concepts_data:
             # Normalize concept name to canonical form
-            canonical_name = self._normalize_concept_name(concept.name)
+            canonical_name = self._normalize_concept_name(concept_name)
 
             # Skip if we've already processed this canonical concept
             if canonical_name in canonical_concepts:
@@ -1133,9 +1324,9 @@ class Neo4jService:
                 start_node_id=theory_id,
                 end_node_id=concept_id,
                 properties=MentionsRelationshipProperties(
-                    original_name=concept.name,
-                    definition=concept.definition,
-                    text_evidence=concept.text_evidence,
+                    original_name=concept_name,
+                    definition=definition,
+                    text_evidence=text_evidence,
                     source_document=source_filename
                 )
             )
@@ -1205,6 +1396,118 @@ class Neo4jService:
                 error=str(e)
             )
 
+    def bulk_ingest(
+        self,
+        graph_documents: List[GraphDocument],
+        batch_size: int = 10_000,
+        single_transaction: bool = False
+    ) -> None:
+        """
+        Write many graph documents with grouped UNWIND queries.
+
+        Nodes are grouped per label and relationships per (source label, type,
+        target label); each group is sent in chunks of `batch_size` rows, all on
+        a single session. All nodes are written before any relationship.
+
+        Args:
+            graph_documents: Documents to write (e.g. from
+                `_create_graph_document_from_construction_plan`)
+            batch_size: Maximum rows per UNWIND query
+            single_transaction: Run every chunk in one write transaction, so the
+                whole write commits or rolls back together. By default each
+                chunk commits on its own, which keeps transactions small for
+                very large ingests.
+
+        Raises:
+            Exception: Whatever the driver raises; with per-chunk commits, chunks
+                committed before the failure stay committed.
+        """
+        node_rows = defaultdict(list)
+        rel_rows = defaultdict(list)
+        for graph_doc in graph_documents:
+            for node in graph_doc.nodes:
+                node_rows[node.type].append({"id": node.id, "properties": node.properties})
+            for rel in graph_doc.relationships:
+                shape = (rel.source.type, rel.type.replace(" ", "_").upper(), rel.target.type)
+                rel_rows[shape].append({
+                    "source": rel.source.id,
+                    "target": rel.target.id,
+                    "properties": rel.properties,
+                })
+
+        chunks = [
+            (_node_merge_query(label), rows[start:start + batch_size])
+            for label, rows in node_rows.items()
+            for start in range(0, len(rows), batch_size)
+        ] + [
+            (_relationship_merge_query(*shape), rows[start:start + batch_size])
+            for shape, rows in rel_rows.items()
+            for start in range(0, len(rows), batch_size)
+        ]
+
+        with self.graph._driver.session(database=self.database) as session:
+            if single_transaction:
+                def write_all(tx):
+                    for query, rows in chunks:
+                        tx.run(query, data=rows).consume()
+
+                session.execute_write(write_all)
+                return
+
+            for query, rows in chunks:
+                session.execute_write(lambda tx: tx.run(query, data=rows).consume())
+
+    def insert_graph_data_batch(
+        self,
+        batch: List[Tuple[Neo4jGraphData, str]]
+    ) -> List[Neo4jInsertionResult]:
+        """
+        Insert graph data for many source files in one write transaction.
+
+        Args:
+            batch: (graph_data, source_file) pairs
+
+        Returns:
+            One Neo4jInsertionResult per pair, in input order. The batch commits
+            as a whole, so if the write fails nothing from it was committed and
+            every file in it is reported as failed.
+        """
+        graph_documents = []
+        results = []
+
+        for graph_data, source_file in batch:
+            neo4j_dict = graph_data.to_dict()
+            if not neo4j_dict.get('nodes'):
+                results.append(Neo4jInsertionResult(
+                    success=False,
+                    source_file=source_file,
+                    error='No nodes to insert'
+                ))
+                continue
+
+            graph_documents.append(self._create_graph_document_from_construction_plan(neo4j_dict))
+            results.append(Neo4jInsertionResult(
+                success=True,
+                nodes_created=len(graph_data.nodes),
+                relationships_created=len(graph_data.relationships),
+                source_file=source_file
+            ))
+
+        try:
+            self.bulk_ingest(graph_documents, single_transaction=True)
+        except Exception as e:
+            logger.error(f"Batch insert of {len(batch)} files failed: {e}")
+            return [
+                Neo4jInsertionResult(
+                    success=False,
+                    source_file=result.source_file,
+                    error=result.error or str(e)
+                )
+                for result in results
+            ]
+
+        return results
+
     def merge_concepts(
         self,
         canonical: str,
@@ -1339,7 +1642,6 @@ class Neo4jService:
         Returns:
             Dictionary with ingestion statistics
         """
-        import json
         from pathlib import Path
         
         print(f"\n{'='*80}")
@@ -1351,8 +1653,7 @@ class Neo4jService:
         if not json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_file_path}")
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(json_path)
         
         # Extract data
         merges = data.get("concept_merges", {}).get("merges", [])